@@ -6,6 +6,9 @@ Handles loading MANIFEST.json, report.json, failures, and log files.
 
 import gzip
 import json
+import mmap
+import os
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator
@@ -28,6 +31,41 @@ def _open_jsonl(path: Path):
     return open(path, 'r', encoding='utf-8')
 
 
+def _iter_mmap_lines(mm: mmap.mmap) -> Iterator[bytes]:
+    """Yield non-blank lines from a mapped file, split with mmap.find."""
+    pos = 0
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b'\n', pos)
+        if end == -1:
+            end = size
+        line = mm[pos:end]
+        pos = end + 1
+        if line.strip():
+            yield line
+
+
+@contextmanager
+def _jsonl_lines(path: Path) -> Iterator[Iterator[bytes]]:
+    """Open a JSONL file and yield an iterator over its non-blank lines as bytes.
+
+    Plain files are memory-mapped and split without decoding, which is
+    cheaper than a text-mode line iterator for large result files. Lines
+    can be passed straight to json_io.loads / json.loads.
+    """
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rb') as f:
+            yield (line for line in f if line.strip())
+        return
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file
+            yield iter(())
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield _iter_mmap_lines(mm)
+
+
 @dataclass
 class StepStatus:
     """Status of a pipeline step."""
@@ -28,6 +28,7 @@ from ..utils import (
     scan_pipelines,
     calculate_dashboard_stats,
 )
+from ..utils import json_io
 from ..utils.formatting import compute_eta_seconds, format_eta
 from ..utils.runs import (
     get_run_process_status,
@@ -43,6 +44,7 @@ from ..utils.runs import (
     check_manifest_consistency,
     resume_orchestrator,
     reset_unit_retries,
+    wait_for_orchestrator_ready,
 )
 from .common import _log, check_missing_api_keys, get_resource_stats, set_os_terminal_title
 
@@ -50,6 +52,9 @@ from .common import _log, check_missing_api_keys, get_resource_stats, set_os_ter
 # Braille spinner frames for running rows
 SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
+# Toast severities in ascending order, for picking the worst of a batch
+_SEVERITY_RANK = {"information": 0, "warning": 1, "error": 2}
+
 
 class HomeScreen(Screen):
     """Dashboard home screen with stats and unified runs table."""
@@ -167,6 +172,8 @@ class HomeScreen(Screen):
         self._batch_wait_toasts_shown: set[str] = set()  # run names that got the queue toast
         self._show_archived: bool = False
         self._selected_runs: set[int] = set()  # indices of multi-selected runs for comparison
+        self._retrying_runs: set[str] = set()  # run paths with a retry worker in flight
+        self._notify_buffer: list[tuple[str, str]] = []  # (message, severity) awaiting flush
 
     def _render_header(self) -> str:
         """Render header with version and resource stats on the right."""
@@ -1444,7 +1451,7 @@ class HomeScreen(Screen):
 
         run = self._get_selected_run()
         if not run:
-            self.app.notify("No run selected", severity="warning")
+            self._queue_notify("No run selected", severity="warning")
             return
 
         run_dir = Path(run.get('path', ''))
@@ -1452,7 +1459,7 @@ class HomeScreen(Screen):
         mode = run.get('mode', 'batch')
 
         if not run_dir.exists():
-            self.app.notify("Run path not found", severity="error")
+            self._queue_notify("Run path not found", severity="error")
             return
 
         health = get_process_health(run_dir)
@@ -1477,7 +1484,7 @@ class HomeScreen(Screen):
             hung_seconds = health.get("last_activity_seconds", 0)
             hung_minutes = int(hung_seconds // 60)
 
-            self.app.notify(f"Killing hung process (PID {pid}) and restarting...")
+            self._queue_notify(f"Killing hung process (PID {pid}) and restarting...")
             _log.debug(f"Killing hung process PID {pid}, inactive for {hung_minutes}m")
 
             try:
@@ -1496,7 +1503,7 @@ class HomeScreen(Screen):
             except ProcessLookupError:
                 pass
             except Exception as e:
-                self.app.notify(f"Failed to kill process: {e}", severity="error")
+                self._queue_notify(f"Failed to kill process: {e}", severity="error")
                 return
 
             pid_file = run_dir / "orchestrator.pid"
@@ -1515,7 +1522,7 @@ class HomeScreen(Screen):
             if manifest_status == "complete":
                 unit_failures = run.get('unit_failure_count', 0)
                 if unit_failures == 0:
-                    self.app.notify("Run completed with no failures", severity="information")
+                    self._queue_notify("Run completed with no failures", severity="information")
                     return
                 self._retry_failed_units(run_dir, mode)
                 return
@@ -1534,8 +1541,8 @@ class HomeScreen(Screen):
                         for c in chunks.values()
                     )
                     if all_initial_pending:
-                        self.app.notify(f"Resuming pre-flight failed run '{run.get('name', '')}'...")
-                        self._update_manifest_for_restart(run_dir)
+                        self._queue_notify(f"Resuming pre-flight failed run '{run.get('name', '')}'...")
+                        self._update_manifest_for_restart(run_dir, manifest)
                         self._start_orchestrator(run_dir, mode)
                         return
                 except Exception:
@@ -1545,7 +1552,7 @@ class HomeScreen(Screen):
                 return
 
             if manifest_status not in ('detached', 'paused', 'running', 'active', 'zombie', 'stuck', 'pending'):
-                self.app.notify(f"Cannot resume run with status '{manifest_status}'", severity="warning")
+                self._queue_notify(f"Cannot resume run with status '{manifest_status}'", severity="warning")
                 return
 
             if manifest_status == "pending":
@@ -1584,12 +1591,12 @@ class HomeScreen(Screen):
                 )
                 return
 
-            self.app.notify(f"Restarting run '{run.get('name', '')}'...")
+            self._queue_notify(f"Restarting run '{run.get('name', '')}'...")
             self._update_manifest_for_restart(run_dir)
             self._start_orchestrator(run_dir, mode)
             return
 
-        self.app.notify(f"Cannot resume run in state: {manifest_status}", severity="warning")
+        self._queue_notify(f"Cannot resume run in state: {manifest_status}", severity="warning")
 
     def _handle_pending_run_start(self, result, run_dir: Path) -> None:
         """Handle the pending run modal result.
@@ -1605,6 +1612,7 @@ class HomeScreen(Screen):
         model = result.get("model")
 
         # Apply provider/model overrides to the run's snapshot config
+        manifest = None
         if provider or model:
             try:
                 import yaml
@@ -1633,21 +1641,41 @@ class HomeScreen(Screen):
             except Exception:
                 pass  # Best-effort override
 
-        self._update_manifest_for_restart(run_dir)
+        self._update_manifest_for_restart(run_dir, manifest)
         self._start_orchestrator(run_dir, mode)
 
     def _start_orchestrator(self, run_dir: Path, mode: str) -> None:
         """Start an orchestrator process for the run."""
         watch_mode = "watch" if mode.lower() == "batch" else "realtime"
+        self._spawn_orchestrator(run_dir, watch_mode)
 
+    @work(thread=True, group="orchestrator-spawn")
+    def _spawn_orchestrator(self, run_dir: Path, watch_mode: str) -> None:
+        """Spawn the orchestrator in a background thread.
+
+        resume_orchestrator() forks a process and waits briefly to confirm it
+        started, so running it on the UI thread would stall input.
+        """
         success = resume_orchestrator(run_dir, mode=watch_mode)
+        self.app.call_from_thread(self._on_orchestrator_spawned, run_dir, success)
 
+    def _on_orchestrator_spawned(self, run_dir: Path, success: bool) -> None:
+        """Report orchestrator spawn result on the main UI thread."""
         if success:
-            self.app.notify("Orchestrator started")
-            run_path = str(run_dir)
-            self.set_timer(1.0, lambda: self._refresh_and_follow_run(run_path))
+            self._queue_notify("Orchestrator started")
+            self._follow_when_ready(run_dir)
         else:
-            self.app.notify("Failed to start orchestrator", severity="error")
+            self._queue_notify("Failed to start orchestrator", severity="error")
+
+    @work(thread=True, group="orchestrator-follow")
+    def _follow_when_ready(self, run_dir: Path) -> None:
+        """Wait for the orchestrator's PID file, then refresh and follow the run.
+
+        Replaces a fixed startup delay: fast hosts follow immediately, slow
+        hosts wait (up to a timeout) instead of racing the orchestrator.
+        """
+        wait_for_orchestrator_ready(run_dir)
+        self.app.call_from_thread(self._refresh_and_follow_run, str(run_dir))
 
     def _refresh_and_follow_run(self, run_path: str) -> None:
         """Refresh data and move cursor to follow a run to its new position."""
@@ -1655,55 +1683,100 @@ class HomeScreen(Screen):
         self._follow_run(run_path)
 
     def _retry_failed_units(self, run_dir: Path, mode: str) -> None:
-        """Reset all failed units and spawn orchestrator to process retries."""
+        """Reset all failed units and spawn orchestrator to process retries.
+
+        Repeated presses while a retry for the same run is still in flight
+        are coalesced into the pending one.
+        """
         _log.debug(f"_retry_failed_units: run_dir={run_dir}, mode={mode}")
+        run_key = str(run_dir)
+        if run_key in self._retrying_runs:
+            self._queue_notify("Retry already in progress", severity="information")
+            return
+        self._retrying_runs.add(run_key)
+        self._run_retry_worker(run_dir, mode)
+
+    @work(thread=True, group="retry-failed")
+    def _run_retry_worker(self, run_dir: Path, mode: str) -> None:
+        """Background thread: reset failed units and respawn the orchestrator.
+
+        reset_unit_retries() rewrites failure files across every chunk,
+        which can take seconds on large runs.
+        """
+
+        def notify(message: str, **kwargs) -> None:
+            self.app.call_from_thread(self._queue_notify, message, **kwargs)
 
         try:
             reset_count = reset_unit_retries(run_dir)
 
             if reset_count == 0:
-                self.app.notify("No failed units to retry", severity="information")
+                notify("No failed units to retry", severity="information")
                 return
 
             orchestrator_mode = "realtime" if mode == "realtime" else "watch"
             success = resume_orchestrator(run_dir, mode=orchestrator_mode)
 
             if success:
-                self.app.notify(
+                notify(
                     f"Retrying {reset_count} failed units...",
                     severity="information"
                 )
+                wait_for_orchestrator_ready(run_dir)
             else:
-                self.app.notify(
+                notify(
                     f"Reset {reset_count} units but failed to start orchestrator",
                     severity="error"
                 )
-
-            run_path = str(run_dir)
-            self.set_timer(1.0, lambda: self._refresh_and_follow_run(run_path))
+            self.app.call_from_thread(self._refresh_and_follow_run, str(run_dir))
 
         except Exception as e:
             _log.debug(f"_retry_failed_units error: {e}")
-            self.app.notify(f"Retry failed: {e}", severity="error")
+            notify(f"Retry failed: {e}", severity="error")
+        finally:
+            self._retrying_runs.discard(str(run_dir))
 
-    def _update_manifest_for_restart(self, run_dir: Path) -> None:
-        """Update manifest to allow restart."""
-        from datetime import datetime
+    def _update_manifest_for_restart(self, run_dir: Path, manifest: dict | None = None) -> None:
+        """Update manifest to allow restart.
 
+        Args:
+            run_dir: Path to the run directory
+            manifest: Manifest the caller already parsed, reused instead of
+                re-reading MANIFEST.json (mutated in place)
+        """
         manifest_path = run_dir / "MANIFEST.json"
-        if manifest_path.exists():
-            try:
-                manifest = json.loads(manifest_path.read_text())
-                manifest["status"] = "running"
-                manifest["restarted_at"] = datetime.now().isoformat()
-                manifest["updated"] = datetime.now().isoformat()
-                manifest.pop("error_message", None)
-
-                tmp_path = manifest_path.with_suffix(".tmp")
-                tmp_path.write_text(json.dumps(manifest, indent=2))
-                tmp_path.rename(manifest_path)
-            except Exception as e:
-                _log.debug(f"Failed to update manifest for restart: {e}")
+        try:
+            if manifest is None:
+                try:
+                    manifest = json_io.loads(manifest_path.read_bytes())
+                except FileNotFoundError:
+                    return
+            # Already marked as restarted and running: only the timestamps
+            # would change, and resume_orchestrator() touches "updated"
+            # itself, so skip the rewrite.
+            if (
+                manifest.get("status") == "running"
+                and "restarted_at" in manifest
+                and "error_message" not in manifest
+            ):
+                return
+            manifest["status"] = "running"
+            now_iso = datetime.now().isoformat()
+            manifest["restarted_at"] = now_iso
+            manifest["updated"] = now_iso
+            manifest.pop("error_message", None)
+
+            # Flush to disk before swapping in, as _do_retry does, so a crash
+            # can't leave an empty MANIFEST.json; os.replace overwrites
+            # atomically on Windows too, where Path.rename raises
+            tmp_path = run_dir / "MANIFEST.json.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(json_io.dumps_pretty(manifest))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, manifest_path)
+        except Exception as e:
+            _log.debug(f"Failed to update manifest for restart: {e}")
 
     def _handle_restart_confirm(self, confirmed: bool, run_dir: Path, mode: str, pid: int) -> None:
         """Handle restart confirmation for a running process."""
@@ -1724,7 +1797,7 @@ class HomeScreen(Screen):
         except ProcessLookupError:
             pass
         except Exception as e:
-            self.app.notify(f"Failed to kill process: {e}", severity="error")
+            self._queue_notify(f"Failed to kill process: {e}", severity="error")
             return
 
         pid_file = run_dir / "orchestrator.pid"
@@ -1736,7 +1809,30 @@ class HomeScreen(Screen):
 
         self._update_manifest_for_restart(run_dir)
         self._start_orchestrator(run_dir, mode)
-        self.app.notify("Run restarted")
+        self._queue_notify("Run restarted")
+
+    def _queue_notify(self, message: str, severity: str = "information") -> None:
+        """Buffer a toast from the resume/retry flows and flush shortly after.
+
+        These flows can emit several messages in quick succession (e.g.
+        "Restarting..." then "Orchestrator started"); batching them shows a
+        single toast instead of a stack. Must be called on the UI thread.
+        """
+        if not self._notify_buffer:
+            self.set_timer(0.05, self._flush_notifications)
+        self._notify_buffer.append((message, severity))
+
+    def _flush_notifications(self) -> None:
+        """Show all buffered messages as one toast at the highest severity."""
+        if not self._notify_buffer:
+            return
+        messages = [msg for msg, _ in self._notify_buffer]
+        severity = max(
+            (sev for _, sev in self._notify_buffer),
+            key=lambda sev: _SEVERITY_RANK.get(sev, 0),
+        )
+        self._notify_buffer = []
+        self.app.notify("\n".join(messages), severity=severity)
 
     def action_name_run(self) -> None:
         """Set or edit display name for a run (W key)."""
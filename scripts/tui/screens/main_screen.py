@@ -9,10 +9,14 @@ Bottom panel toggles between Chunk View and Unit View with V key.
 import json
 import os
 import re
+import threading
+import time
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
-from typing import Any
-from collections import Counter
+from typing import Any, Callable, Iterator
+from collections import Counter, deque
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, HorizontalScroll, Vertical, VerticalScroll
@@ -25,8 +29,20 @@ from textual.binding import Binding
 from textual import events
 from textual import work
 
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
+try:
+    from watchfiles import watch as watch_files
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
 from version import __version__
-from ..data import RunData, RealtimeProgress, load_run_data, format_tokens, format_time_remaining, _find_jsonl_file, _open_jsonl
+from ..data import RunData, RealtimeProgress, load_run_data, format_tokens, format_time_remaining, _open_jsonl, _jsonl_lines
 from ..modals import LogModal, ArtifactModal
 from ..config_editor import ConfigListScreen
 from ..widgets import render_pipeline_boxes, make_progress_bar
@@ -41,6 +57,7 @@ from .common import (
     set_os_terminal_title,
     _log,
 )
+from ..utils import json_io
 from ..utils.formatting import compute_eta_seconds, format_eta
 from ..utils.runs import (
     get_run_process_status,
@@ -52,6 +69,239 @@ from ..utils.runs import (
 
 
 SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+_SPINNER_LEN = len(SPINNER_FRAMES)
+
+# [2026-01-28T19:11:03Z] [POLL] msg → captures ("19:11:03", "[POLL] msg")
+_LOG_TS_RE = re.compile(r'\[[\d-]+T([\d:]+)Z?\]\s*(.+)')
+# Scroll stride per pipeline step in _scroll_to_selected_step. Each step box
+# is box_width(18) + 2 borders + arrow_gap(5) = 25 chars.
+_PIPELINE_STEP_WIDTH = 23
+_UNIT_ID_KEY = itemgetter("unit_id")
+_STEP_UNIT_KEY = itemgetter("step", "unit_id")
+# Matched against raw log bytes; ✓/✗ as their UTF-8 sequences
+_UNIT_LOG_RE = re.compile(rb'\[\d+/\d+\]\s+(\S+)\s+(?:\xe2\x9c\x93|\xe2\x9c\x97)')
+
+
+def _split_log_timestamp(line: str) -> tuple[str, str] | None:
+    """Split "[<date>T<time>Z] rest" into (time, rest), or None if no timestamp.
+
+    RUN_LOG.txt is written only by octobatch_utils.log_message, which emits a
+    fixed-width "[YYYY-MM-DDTHH:MM:SSZ] " prefix, so that shape is handled
+    by slicing. Anything else (older or hand-edited logs) falls back to
+    _LOG_TS_RE.
+    """
+    if not line.startswith("["):
+        return None
+    if line[20:22] == "Z]" and line[11:12] == "T" and line[12:20].replace(":", "").isdigit():
+        rest = line[22:].lstrip()
+        if rest:
+            return line[12:20], rest
+    match = _LOG_TS_RE.match(line)
+    return match.groups() if match else None
+
+
+def _tail_lines(path: Path, num_lines: int, block_size: int = 4096, max_bytes: int = 65536) -> list[str]:
+    """Read the last num_lines lines of a file by scanning backwards.
+
+    Reads block_size chunks from the end until enough newlines are buffered
+    (or max_bytes is reached), so only the tail of a large log is read and
+    decoded. Leading/trailing whitespace of the tail is stripped.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= num_lines and len(buf) < max_bytes:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+    buf = buf.strip()
+    if not buf:
+        return []
+    return [line.decode("utf-8", errors="replace") for line in buf.split(b"\n")[-num_lines:]]
+
+
+_BLANK_LINE_MARKERS = (b"\n\n", b"\n\r", b"\n ", b"\n\t")
+
+
+def _count_nonblank_lines(data: bytes, end: int) -> int:
+    """Count the non-blank newline-terminated lines in data[:end].
+
+    Writers never emit blank lines in practice, so the newlines are counted
+    in C with bytes.count; only a buffer that could hold a whitespace-only
+    line is split and checked line by line.
+    """
+    if data[:1].isspace() or any(data.find(m, 0, end) != -1 for m in _BLANK_LINE_MARKERS):
+        return sum(1 for line in data[:end].split(b"\n")[:-1] if line.strip())
+    return data.count(b"\n", 0, end)
+
+
+def _iter_json_rows(lines: Iterator[bytes]) -> Iterator[dict]:
+    """Parse JSONL lines into dicts, silently skipping malformed lines.
+
+    A line that isn't valid UTF-8 JSON, or parses to something other than
+    an object, is skipped on its own so one corrupt row doesn't cost the
+    rest of the file.
+    """
+    loads = json_io.loads
+    for line in lines:
+        try:
+            row = loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(row, dict):
+            yield row
+
+
+def _iter_jsonl_from(f) -> Iterator[tuple[int, Any]]:
+    """Yield (end offset, row) for each non-blank line from f's position.
+
+    row is None for a complete line that fails to parse. A last line
+    without a newline that doesn't parse is taken to be mid-write and is
+    not yielded, so the caller's offset stops before it.
+    """
+    loads = json_io.loads
+    pos = f.tell()
+    for line in f:
+        pos += len(line)
+        if not line.strip():
+            continue
+        try:
+            row = loads(line)
+        except json.JSONDecodeError:
+            if not line.endswith(b"\n"):
+                return
+            row = None
+        yield pos, row
+
+
+# Per-file accumulators for MainScreen._fold_jsonl. A new_* function starts
+# a fresh accumulator from the previous one (None for a full read), and the
+# matching add_* folds one row into it (None for an unparseable line).
+
+def _new_validated_stats(prev: dict | None) -> dict:
+    if prev is None:
+        return {"ids": set(), "iters_total": 0, "iters_count": 0}
+    return {"ids": set(prev["ids"]), "iters_total": prev["iters_total"], "iters_count": prev["iters_count"]}
+
+
+def _add_validated_row(acc: dict, row: Any) -> None:
+    if row is None:
+        return
+    uid = row.get("unit_id")
+    if uid:
+        acc["ids"].add(uid)
+    iters = row.get("_metadata", {}).get("iterations")
+    if iters is not None:
+        acc["iters_total"] += iters
+        acc["iters_count"] += 1
+
+
+def _new_failure_stats(prev: dict | None) -> dict:
+    # retry_counts: retry_count -> validation-failure rows; groups: (stage, pattern) -> rows
+    if prev is None:
+        return {"ids": set(), "hard": 0, "retry_counts": Counter(), "groups": Counter()}
+    return {
+        "ids": set(prev["ids"]),
+        "hard": prev["hard"],
+        "retry_counts": Counter(prev["retry_counts"]),
+        "groups": Counter(prev["groups"]),
+    }
+
+
+def _add_failure_row(acc: dict, row: Any) -> None:
+    if row is None:
+        # Unparseable records count as hard failures
+        acc["hard"] += 1
+        acc["groups"][("hard", "parse error")] += 1
+        return
+    uid = row.get("unit_id")
+    if uid:
+        acc["ids"].add(uid)
+    if row.get("failure_stage", "validation") in _VALIDATION_STAGES:
+        stage = "validation"
+        acc["retry_counts"][row.get("retry_count", 0)] += 1
+    else:
+        stage = "hard"
+        acc["hard"] += 1
+    # Extract a short error pattern
+    error_msg = row.get("error_message", "") or row.get("error", "") or ""
+    if not error_msg:
+        # Try to get from nested validation_errors
+        val_errors = row.get("validation_errors", [])
+        if val_errors and isinstance(val_errors, list):
+            error_msg = str(val_errors[0])[:80]
+    # Truncate and normalize for grouping
+    pattern = error_msg[:80].strip() if error_msg else "unknown"
+    acc["groups"][(stage, pattern)] += 1
+
+
+# Minimum seconds between Otto narrative rebuilds while the run status is unchanged
+_NARRATIVE_MIN_INTERVAL = 10.0
+
+# Chunk states that no longer advance
+_TERMINAL_CHUNK_STATES = frozenset(("VALIDATED", "FAILED"))
+_TERMINAL_RUN_STATUSES = frozenset(("complete", "failed", "killed"))
+
+# failure_stage values that count as (retryable) validation failures
+_VALIDATION_STAGES = frozenset(("schema_validation", "validation"))
+
+# Index of total_items in MainScreen._build_manifest_signature's tuple
+_SIG_TOTAL_ITEMS = 3
+
+_STEP_STATE_SUFFIXES = frozenset(("SUBMITTED", "PENDING", "COMPLETE"))
+
+# A directory listing taken within this long of the directory's mtime isn't
+# trusted on the next lookup: with coarse (1-2 s) timestamps an entry added in
+# the same tick leaves the mtime unchanged. Same rule as git's racy index.
+_RACY_MTIME_NS = 2_000_000_000
+
+# Fixed header blocks for the chunk/unit stats side panel
+_STATS_RULE = "\u2500" * 20
+_CHUNK_STATS_HEADER = f"[bold]Chunk Stats[/]\n{_STATS_RULE}\n"
+_UNIT_STATS_HEADER = f"[bold]Unit Stats[/]\n{_STATS_RULE}\n"
+_FILTERS_HEADER = f"\n\n[bold]Filters[/]\n{_STATS_RULE}\n"
+
+
+@lru_cache(maxsize=256)
+def _step_from_chunk_state(state: str) -> str | None:
+    """Extract step name from chunk state like 'generate_SUBMITTED'.
+
+    Only a handful of distinct states exist per run, so results are cached.
+    """
+    # States look like: generate_SUBMITTED, score_coherence_PENDING, VALIDATED
+    if not state or state in ("VALIDATED", "PENDING", "FAILED"):
+        return None
+    step, sep, suffix = state.rpartition("_")
+    if sep and suffix in _STEP_STATE_SUFFIXES:
+        return step
+    return None
+
+
+def _is_refresh_trigger(change: Any, path: str) -> bool:
+    """watchfiles filter: only manifest and validated/failure output changes."""
+    name = os.path.basename(path)
+    return name == "MANIFEST.json" or name.endswith(
+        ("_validated.jsonl", "_failures.jsonl", "_validated.jsonl.gz", "_failures.jsonl.gz")
+    )
+
+
+def _format_str_value(value: str) -> str:
+    # Truncate long strings for display
+    if len(value) > 60:
+        return f'[green]"{value[:57]}..."[/]'
+    return f'[green]"{value}"[/]'
+
+
+# Leaf formatters for JSON tree nodes, keyed on exact type. bool gets its own
+# entry since type(True) is bool, not int.
+_FORMAT_DISPATCH = {
+    str: _format_str_value,
+    bool: lambda v: f"[yellow]{str(v).lower()}[/]",
+    int: lambda v: f"[blue]{v}[/]",
+    float: lambda v: f"[blue]{v}[/]",
+    type(None): lambda v: "[dim]null[/]",
+}
 
 
 class LogTicker(Static):
@@ -70,59 +320,77 @@ class LogTicker(Static):
         super().__init__(**kwargs)
         self.run_dir = run_dir
         self.max_lines = max_lines  # 4 log lines + 1 header = 5 visible lines
-        self._log_lines: list[str] = []
+        # Bounded buffers refilled in place on each log change
+        self._log_lines: deque[str] = deque(maxlen=max_lines)
         self._spinner_index: int = 0
         self._is_running: bool = False
+        self._log_signature: tuple[int, int] | None = None  # (mtime_ns, size) of last read
+        self._formatted_lines: deque[str] = deque(maxlen=max_lines)  # _log_lines passed through _format_log_line
+        self._last_render_key: tuple | None = None
+        self._dirty_since_hidden: bool = False  # a tick was skipped while not visible
+
+    def on_show(self) -> None:
+        """Catch up on any ticks skipped while the ticker was hidden."""
+        if self._dirty_since_hidden:
+            self.update_logs(self._is_running)
 
     def update_logs(self, is_running: bool = False) -> None:
-        """Read latest log entries from RUN_LOG.txt and refresh display."""
-        self._is_running = is_running
-        self._spinner_index += 1  # Advance spinner each update
+        """Read latest log entries from RUN_LOG.txt and refresh display.
 
-        log_file = self.run_dir / "RUN_LOG.txt"
-        if not log_file.exists():
-            self._log_lines = []
-            self.update(self._render_lines())
-            self.refresh()
+        The file is only re-read when its (mtime, size) changes, so idle
+        ticks cost a single stat. Ticks are skipped entirely while the widget
+        is hidden or has no area; on_show replays the latest one.
+        """
+        self._is_running = is_running
+        if not self.display or not self.region.area:
+            self._dirty_since_hidden = True
             return
+        self._dirty_since_hidden = False
+        # Advance spinner each update, kept within frame range
+        self._spinner_index = (self._spinner_index + 1) % _SPINNER_LEN
 
+        log_file = self.run_dir / "RUN_LOG.txt"
         try:
-            # Read last N lines efficiently by seeking from end
-            with open(log_file, "rb") as f:
-                f.seek(0, 2)  # End of file
-                file_size = f.tell()
-
-                # Read last ~4KB (enough for several log lines)
-                read_size = min(4096, file_size)
-                f.seek(max(0, file_size - read_size))
-                content = f.read().decode("utf-8", errors="replace")
-
-                lines = content.strip().split("\n")
-                self._log_lines = lines[-self.max_lines:]
-                self.update(self._render_lines())
-                self.refresh()
+            stat = log_file.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature != self._log_signature:
+                self._log_lines.clear()
+                self._log_lines.extend(_tail_lines(log_file, self.max_lines))
+                self._formatted_lines.clear()
+                self._formatted_lines.extend(map(self._format_log_line, self._log_lines))
+                self._log_signature = signature
         except Exception:
-            self._log_lines = []
-            self.update(self._render_lines())
-            self.refresh()
+            self._log_lines.clear()
+            self._formatted_lines.clear()
+            self._log_signature = None
+
+        # Skip the markup rebuild and widget update when neither the log
+        # nor the visible spinner frame changed (e.g. every idle tick)
+        spinner_frame = self._spinner_index if is_running else None
+        render_key = (self._log_signature, spinner_frame)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # Static.update() already schedules a refresh
+        self.update(self._render_lines())
 
     def _render_lines(self) -> str:
         """Render the log lines with header (and spinner if running)."""
         if self._is_running:
-            spinner = SPINNER_FRAMES[self._spinner_index % len(SPINNER_FRAMES)]
+            spinner = SPINNER_FRAMES[self._spinner_index]
             header = f"[bold cyan]{spinner} Recent Activity[/]"
         else:
             header = "[bold cyan]Recent Activity[/]"
 
-        if not self._log_lines:
+        if not self._formatted_lines:
             return f"{header}\n[dim]Waiting for activity...[/]"
 
         output = [header]
-        for i, line in enumerate(self._log_lines):
-            formatted = self._format_log_line(line)
-
+        last = len(self._formatted_lines) - 1
+        for i, formatted in enumerate(self._formatted_lines):
             # Highlight newest line (last one)
-            if i == len(self._log_lines) - 1:
+            if i == last:
                 output.append(f"[bold]{formatted}[/]")
             else:
                 output.append(f"[dim]{formatted}[/]")
@@ -132,9 +400,9 @@ class LogTicker(Static):
     def _format_log_line(self, line: str) -> str:
         """Format a log line for display, shortening timestamp."""
         # Convert [2026-01-28T19:11:03Z] [POLL] msg → [19:11:03] [POLL] msg
-        match = re.match(r'\[[\d-]+T([\d:]+)Z?\]\s*(.+)', line)
-        if match:
-            time_part, rest = match.groups()
+        parts = _split_log_timestamp(line)
+        if parts:
+            time_part, rest = parts
             formatted = f"[{time_part}] {rest}"
             # Truncate if too long
             if len(formatted) > 80:
@@ -237,9 +505,25 @@ class UnitDetailModal(ModalScreen):
     # View mode: "tree", "raw", or "response"
     view_mode = reactive("tree", init=False)
 
-    def __init__(self, unit: dict, **kwargs):
+    def __init__(self, unit: dict, tree_spec_cache: dict | None = None, **kwargs):
         super().__init__(**kwargs)
         self.unit = unit
+        # id(data) -> (data, spec) for built tree levels; MainScreen passes a
+        # dict that outlives the modal so reopening a unit skips formatting
+        self._tree_spec_cache: dict[int, tuple[Any, list]] = (
+            tree_spec_cache if tree_spec_cache is not None else {}
+        )
+        # View widgets toggled by watch_view_mode, captured in compose()
+        self._tree_w: Tree | None = None
+        self._tree_label_w: Static | None = None
+        self._raw_w: VerticalScroll | None = None
+        self._response_w: Vertical | None = None
+        self._footer_w: Static | None = None
+        self._raw_json_w: Static | None = None
+        self._response_tree_w: Tree | None = None
+        # Raw JSON and LLM response views are filled on first switch to them
+        self._raw_rendered = False
+        self._response_built = False
 
     def compose(self) -> ComposeResult:
         with Vertical(id="modal-container"):
@@ -252,32 +536,37 @@ class UnitDetailModal(ModalScreen):
 
             # Tree label
             label = "[bold]Input Data:[/]" if self.unit.get("status") == "failed" else "[bold]Result Data:[/]"
-            yield Static(label, id="tree-label")
+            self._tree_label_w = Static(label, id="tree-label")
+            yield self._tree_label_w
 
             # JSON Tree view (input/context data)
             tree: Tree[dict] = Tree("data", id="json-tree")
             tree.root.expand()
             self._build_tree(tree.root, self.unit.get("data", {}))
+            self._tree_w = tree
             yield tree
 
             # Raw JSON view (hidden by default) - markup=False to avoid parsing issues
-            with VerticalScroll(id="raw-json-container", classes="hidden"):
-                yield Static(self._render_raw_json(), id="raw-json", markup=False)
+            self._raw_w = VerticalScroll(id="raw-json-container", classes="hidden")
+            with self._raw_w:
+                self._raw_json_w = Static("", id="raw-json", markup=False)
+                yield self._raw_json_w
 
             # LLM Response view (hidden by default) - for failed units with raw_response
-            with Vertical(id="response-container", classes="hidden"):
+            self._response_w = Vertical(id="response-container", classes="hidden")
+            with self._response_w:
                 yield Static("[bold yellow]Raw LLM Response (Failed Validation)[/]", id="response-label")
                 response_tree: Tree[dict] = Tree("response", id="response-tree")
                 response_tree.root.expand()
-                raw_response = self.unit.get("raw_response")
-                if raw_response:
-                    self._build_tree(response_tree.root, raw_response)
-                else:
+                if not self.unit.get("raw_response"):
                     response_tree.root.add_leaf("[dim]No raw_response captured[/]")
+                    self._response_built = True
+                self._response_tree_w = response_tree
                 yield response_tree
 
             # Footer
-            yield Static(self._render_modal_footer(), id="modal-footer")
+            self._footer_w = Static(self._render_modal_footer(), id="modal-footer")
+            yield self._footer_w
 
     def _render_header(self) -> str:
         """Render modal header with unit info."""
@@ -320,37 +609,77 @@ class UnitDetailModal(ModalScreen):
         return "\n".join(lines)
 
     def _build_tree(self, node: TreeNode, data: Any) -> None:
-        """Recursively build the tree, expanding all nodes by default."""
+        """Build one level of the tree under node.
+
+        Nested dicts/lists become collapsed branches carrying their value in
+        node.data; their children are built on first expand (see
+        on_tree_node_expanded), so large payloads open instantly. The
+        formatted level is kept in the shared spec cache, so reopening the
+        modal for the same unit replays it instead of re-formatting.
+        """
+        cached = self._tree_spec_cache.get(id(data))
+        if cached is not None and cached[0] is data:
+            spec = cached[1]
+        else:
+            spec = self._tree_spec(data)
+            self._tree_spec_cache[id(data)] = (data, spec)
+
+        for label, branch_data in spec:
+            if branch_data is None:
+                node.add_leaf(label)
+            else:
+                node.add(label, data=branch_data)
+
+    def _tree_spec(self, data: Any) -> list[tuple[str, Any]]:
+        """Describe one tree level as (label, branch data or None for a leaf).
+
+        Empty dicts/lists become plain leaves rather than branches.
+        """
+        if isinstance(data, (dict, list)) and not data:
+            return [("[dim](empty)[/]", None)]
+
+        spec: list[tuple[str, Any]] = []
         if isinstance(data, dict):
-            node.expand()
             for key, value in data.items():
                 if isinstance(value, (dict, list)):
-                    # Branch node for nested structures
-                    child = node.add(f"[bold cyan]{key}[/]")
-                    self._build_tree(child, value)
+                    if value:
+                        # Branch node for nested structures, populated lazily
+                        spec.append((f"[bold cyan]{key}[/]", value))
+                    else:
+                        spec.append((f"[cyan]{key}[/]: [dim](empty)[/]", None))
                 else:
                     # Leaf node with value
-                    node.add_leaf(f"[cyan]{key}[/]: {self._format_value(value)}")
+                    spec.append((f"[cyan]{key}[/]: {self._format_value(value)}", None))
 
         elif isinstance(data, list):
-            node.expand()
             for i, item in enumerate(data):
                 if isinstance(item, (dict, list)):
-                    child = node.add(f"[dim][{i}][/]")
-                    self._build_tree(child, item)
+                    if item:
+                        spec.append((f"[dim][{i}][/]", item))
+                    else:
+                        spec.append((f"[dim][{i}][/]: [dim](empty)[/]", None))
                 else:
-                    node.add_leaf(f"[dim][{i}][/]: {self._format_value(item)}")
+                    spec.append((f"[dim][{i}][/]: {self._format_value(item)}", None))
         else:
             # Single value at root (rare)
-            node.add_leaf(self._format_value(data))
+            spec.append((self._format_value(data), None))
+        return spec
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Build a lazily-populated branch the first time it is expanded."""
+        node = event.node
+        if node.data is not None and not node.children:
+            data, node.data = node.data, None
+            self._build_tree(node, data)
 
     def _format_value(self, value: Any) -> str:
         """Format a leaf value with syntax highlighting."""
+        formatter = _FORMAT_DISPATCH.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        # Subclasses of the JSON types (rare) take the slow path
         if isinstance(value, str):
-            # Truncate long strings for display
-            if len(value) > 60:
-                return f'[green]"{value[:57]}..."[/]'
-            return f'[green]"{value}"[/]'
+            return _format_str_value(value)
         elif isinstance(value, bool):
             return f"[yellow]{str(value).lower()}[/]"
         elif isinstance(value, (int, float)):
@@ -367,14 +696,9 @@ class UnitDetailModal(ModalScreen):
             data = self.unit.get("data", {})
 
         raw = json.dumps(data, indent=2)
-        lines = raw.split("\n")
 
         # Format with line numbers - plain text only (markup=False on the Static)
-        formatted_lines = []
-        for i, line in enumerate(lines, 1):
-            formatted_lines.append(f"{i:4}  {line}")
-
-        return "\n".join(formatted_lines)
+        return "\n".join(f"{i:4}  {line}" for i, line in enumerate(raw.split("\n"), 1))
 
     def _render_modal_footer(self) -> str:
         """Render footer based on current view mode."""
@@ -394,31 +718,36 @@ class UnitDetailModal(ModalScreen):
 
     def watch_view_mode(self, new_mode: str) -> None:
         """Toggle visibility when view mode changes."""
-        try:
-            tree = self.query_one("#json-tree", Tree)
-            tree_label = self.query_one("#tree-label", Static)
-            raw_container = self.query_one("#raw-json-container", VerticalScroll)
-            response_container = self.query_one("#response-container", Vertical)
-            footer = self.query_one("#modal-footer", Static)
-
-            # Hide all views first
-            tree.add_class("hidden")
-            tree_label.add_class("hidden")
-            raw_container.add_class("hidden")
-            response_container.add_class("hidden")
-
-            # Show the selected view
-            if new_mode == "tree":
-                tree.remove_class("hidden")
-                tree_label.remove_class("hidden")
-            elif new_mode == "raw":
-                raw_container.remove_class("hidden")
-            else:  # response
-                response_container.remove_class("hidden")
-
-            footer.update(self._render_modal_footer())
-        except NoMatches:
-            pass
+        tree = self._tree_w
+        tree_label = self._tree_label_w
+        raw_container = self._raw_w
+        response_container = self._response_w
+        footer = self._footer_w
+        if footer is None:
+            return  # Not composed yet
+
+        # Hide all views first
+        tree.add_class("hidden")
+        tree_label.add_class("hidden")
+        raw_container.add_class("hidden")
+        response_container.add_class("hidden")
+
+        # Show the selected view
+        if new_mode == "tree":
+            tree.remove_class("hidden")
+            tree_label.remove_class("hidden")
+        elif new_mode == "raw":
+            if not self._raw_rendered:
+                self._raw_json_w.update(self._render_raw_json())
+                self._raw_rendered = True
+            raw_container.remove_class("hidden")
+        else:  # response
+            if not self._response_built:
+                self._build_tree(self._response_tree_w.root, self.unit.get("raw_response"))
+                self._response_built = True
+            response_container.remove_class("hidden")
+
+        footer.update(self._render_modal_footer())
 
     def action_view_tree(self) -> None:
         """Switch to tree view (input/context data)."""
@@ -441,9 +770,10 @@ class UnitDetailModal(ModalScreen):
 
     def action_copy(self) -> None:
         """Copy full JSON to clipboard (not truncated)."""
+        if not PYPERCLIP_AVAILABLE:
+            self.notify("pyperclip not installed", severity="warning")
+            return
         try:
-            import pyperclip
-
             if self.unit.get("status") == "failed":
                 content = json.dumps(self.unit, indent=2)
             else:
@@ -451,8 +781,6 @@ class UnitDetailModal(ModalScreen):
 
             pyperclip.copy(content)
             self.notify("Copied to clipboard")
-        except ImportError:
-            self.notify("pyperclip not installed", severity="warning")
         except Exception as e:
             self.notify(f"Copy failed: {e}", severity="error")
 
@@ -550,13 +878,13 @@ class TroubleshootPromptModal(ModalScreen):
         self.dismiss(None)
 
     def action_copy(self) -> None:
+        if not PYPERCLIP_AVAILABLE:
+            self.notify("pyperclip not installed", severity="warning")
+            return
         try:
-            import pyperclip
             editor = self.query_one("#troubleshoot-editor", TextArea)
             pyperclip.copy(editor.text)
             self.notify("Prompt copied to clipboard")
-        except ImportError:
-            self.notify("pyperclip not installed", severity="warning")
         except Exception as e:
             self.notify(f"Copy failed: {e}", severity="error")
 
@@ -755,10 +1083,16 @@ class MainScreen(Screen):
         self._chunks_for_step: list = []
         self._all_units: list[dict] = []
         self._filtered_units: list[dict] = []
+        self._filtered_cache: dict[tuple, list[dict]] = {}  # (status, step, sort) -> filtered units
+        self._unit_status_counts: Counter = Counter()  # status -> count over _all_units, set on load
         self._unique_steps: list[str] = []
         self._chunk_table: DataTable | None = None
         self._unit_table: DataTable | None = None
-        self._poll_timer = None
+        self._detail_header: Static | None = None  # header above whichever detail table is mounted
+        self._poll_timer = None  # pending _do_refresh timer
+        self._unit_poll_timer = None  # pending _do_unit_refresh timer
+        self._idle_toast_timer = None  # pending _check_batch_idle_toast re-check
+        self._narrative_timer = None  # pending rate-limited Otto narrative update
         self._spinner_index: int = 0
         self._refresh_active: bool = False
         self._units_loading: bool = False
@@ -768,13 +1102,38 @@ class MainScreen(Screen):
         self._otto_orchestrator: OttoOrchestrator | None = None
         self._previous_chunk_states: dict[str, str] = {}
         self._previous_chunk_retries: dict[str, int] = {}
+        self._diffed_manifest: dict | None = None  # manifest object last walked by _diff_chunk_states
+        self._last_narrative_status: str | None = None  # status of the last Otto narrative update
+        self._last_narrative_ts: float = 0.0  # time.monotonic() of that update
+        # path -> ((mtime_ns, size), read offset, bytes before offset, rows so far, read to EOF);
+        # unit-loader worker only, holds just the files of the last unit load
+        self._jsonl_rows_cache: dict[Path, tuple[tuple[int, int], int, bytes, list[dict], bool]] = {}
+        self._chunk_files_cache: dict[Path, tuple[int, frozenset[str], bool]] = {}  # chunk_dir -> (dir mtime_ns, file names, trusted)
+        self._chunk_dirs_cache: dict[tuple[Path, str], tuple[int, list[Path], bool]] = {}  # (chunks_dir, prefix) -> (dir mtime_ns, subdirs, trusted)
+        self._record_count_cache: dict[Path, tuple[tuple[int, int], int, bytes, int, int]] = {}  # path -> (sig, offset, check bytes, whole-line count, total)
+        # path -> (sig, offset, check bytes, per-file stats); see _fold_jsonl
+        self._validated_stats_cache: dict[Path, tuple[tuple[int, int], int, bytes, dict]] = {}
+        self._failure_stats_cache: dict[Path, tuple[tuple[int, int], int, bytes, dict]] = {}
         self._idle_toast_shown: bool = False
         self._cached_max_retries: int | None = None
         self._last_pipeline_content: str = ""
+        self._last_chunk_stats_content: str = ""  # last text pushed to #chunk-stats-panel
+        self._last_manifest_status: str | None = None  # MANIFEST.json status; set in on_mount before first render
+        self._terminal_scan_cache: dict[tuple, Any] = {}  # per-step disk scan results while the run is terminal
         self._last_manifest_signature: tuple | None = None
+        self._manifest_cache: tuple[tuple[int, int], dict] | None = None  # ((mtime_ns, size), manifest)
+        self._providers_cache: set[str] | None = None  # providers from config.yaml, None until loaded
+        self._run_config: dict | None = None  # parsed config/config.yaml snapshot
+        self._proc_probe_cache: tuple[float, dict, bool] | None = None  # (monotonic ts, proc status, has_errors)
+        self._run_config_loaded: bool = False
+        self._latest_submit_cache: tuple[dict, Any] | None = None  # (manifest, latest submitted_at)
+        self._unit_tree_spec_cache: dict[int, tuple[Any, list]] = {}  # shared with UnitDetailModal, reset on unit reload
+        self._watch_stop = threading.Event()  # stops the watchfiles worker
+        self._manifest_sig_cache: tuple[dict, tuple] | None = None  # (manifest, signature)
         self._pending_units_refresh: bool = True
-        self._failure_summary_cache: dict[str, list[tuple[str, str, int]]] = {}  # step -> [(stage, msg, count)]
-        self._failure_summary_mtimes: dict[str, float] = {}  # step -> max mtime of failure files
+        self._cost_cache: tuple[dict, tuple[float, int]] | None = None  # (manifest, (cost, tokens))
+        self._chunk_totals_cache: tuple[list, tuple[int, int, int]] | None = None  # (run_data.chunks, totals)
+        self._log_unit_cache: tuple[tuple[int, int], str] | None = None  # ((size, mtime_ns), unit_id)
 
     def compose(self) -> ComposeResult:
         yield Static(self._render_header(), id="header")
@@ -806,11 +1165,11 @@ class MainScreen(Screen):
         # Initialize _last_manifest_status BEFORE any rendering, so that
         # _count_step_failures() correctly classifies retrying vs exhausted
         # on the very first render (avoids brief "exhausted" flash).
+        # The parsed manifest is reused by the Otto and idle-toast blocks below.
+        manifest = None
         try:
-            manifest_path = self.run_data.run_dir / "MANIFEST.json"
-            if manifest_path.exists():
-                with open(manifest_path) as f:
-                    manifest = json.load(f)
+            manifest = self._load_manifest_cached()
+            if manifest is not None:
                 self._last_manifest_status = manifest.get("status", "")
                 self._last_manifest_signature = self._build_manifest_signature(manifest)
             else:
@@ -855,10 +1214,7 @@ class MainScreen(Screen):
         # Set initial Otto narrative immediately (don't wait for first 2s refresh tick)
         if self._otto_orchestrator:
             try:
-                manifest_path = self.run_data.run_dir / "MANIFEST.json"
-                if manifest_path.exists():
-                    with open(manifest_path) as f:
-                        manifest = json.load(f)
+                if manifest is not None:
                     manifest_status = manifest.get("status", "")
                     # Detect zombie: manifest says "running" but process is dead
                     if manifest_status == "running":
@@ -877,132 +1233,163 @@ class MainScreen(Screen):
         # Use set_timer with self-rescheduling instead of set_interval
         # (set_interval doesn't work reliably on pushed screens)
         self._refresh_active = True
-        self.set_timer(2.0, self._do_refresh)
-        self.set_timer(5.0, self._do_unit_refresh)
-        self._check_batch_idle_toast()
+        self._arm_refresh()
+        self._arm_unit_refresh()
+        if WATCHFILES_AVAILABLE:
+            self._watch_run_dir()
+        self._check_batch_idle_toast(manifest)
 
         # Splash screen is triggered from OctobatchApp.on_mount, not here
 
-    def _check_batch_idle_toast(self) -> None:
-        """Show a reassuring toast if a batch run has been idle for >60 seconds."""
+    def _check_batch_idle_toast(self, manifest: dict | None = None) -> None:
+        """Show a reassuring toast if a batch run has been idle for >60 seconds.
+
+        Args:
+            manifest: Already-parsed manifest to reuse; loaded if omitted.
+        """
         if self._batch_toast_shown:
             return
         if getattr(self.run_data, 'mode', 'batch') != 'batch':
             return
 
         try:
-            manifest_path = self.run_data.run_dir / "MANIFEST.json"
-            if not manifest_path.exists():
-                return
-            with open(manifest_path) as f:
-                manifest = json.load(f)
-            if manifest.get("status") != "running":
+            if manifest is None:
+                manifest = self._load_manifest_cached()
+            if manifest is None or manifest.get("status") != "running":
                 return
 
-            # Find the most recent state-change timestamp across all chunks
+            # Find the most recent state-change timestamp across all chunks.
+            # Parsing every submitted_at is O(chunks), so reuse the result
+            # while the cached manifest object is unchanged.
             from datetime import datetime, timezone
-            latest_ts = None
-            for chunk_data in manifest.get("chunks", {}).values():
-                submitted_at = chunk_data.get("submitted_at")
-                if submitted_at:
-                    try:
-                        ts = datetime.fromisoformat(submitted_at.replace("Z", "+00:00"))
-                        if latest_ts is None or ts > latest_ts:
-                            latest_ts = ts
-                    except (ValueError, TypeError):
-                        pass
+            cached = self._latest_submit_cache
+            if cached is not None and cached[0] is manifest:
+                latest_ts = cached[1]
+            else:
+                def _parsed_submits():
+                    for chunk_data in manifest.get("chunks", {}).values():
+                        submitted_at = chunk_data.get("submitted_at")
+                        if submitted_at:
+                            try:
+                                yield datetime.fromisoformat(submitted_at.replace("Z", "+00:00"))
+                            except (ValueError, TypeError):
+                                pass
+                latest_ts = max(_parsed_submits(), default=None)
+                self._latest_submit_cache = (manifest, latest_ts)
 
             if latest_ts is None:
                 return
 
             elapsed = (datetime.now(timezone.utc) - latest_ts).total_seconds()
-            if elapsed > 60:
-                self._batch_toast_shown = True
-                # Determine provider(s) from run config
-                server_msg = "Your job is processing via batch API."
-                try:
-                    import yaml
-                    config_path = self.run_data.run_dir / "config" / "config.yaml"
-                    if config_path.exists():
-                        with open(config_path) as cf:
-                            config = yaml.safe_load(cf)
-                        providers = set()
-                        global_provider = config.get("api", {}).get("provider", "")
-                        if global_provider:
-                            providers.add(global_provider)
-                        for step_cfg in config.get("pipeline", {}).get("steps", []):
-                            if isinstance(step_cfg, dict) and step_cfg.get("provider"):
-                                providers.add(step_cfg["provider"])
-                        if len(providers) == 1:
-                            provider_name = next(iter(providers))
-                            display_names = {
-                                "gemini": "Google",
-                                "openai": "OpenAI",
-                                "anthropic": "Anthropic",
-                            }
-                            display = display_names.get(provider_name, provider_name.title())
-                            server_msg = f"Your job is running on {display}'s servers."
-                except Exception:
-                    pass
-                self.notify(
-                    f"Batch processing can take several minutes. {server_msg}",
-                    timeout=8,
-                )
+            if elapsed <= 60:
+                # Not idle long enough yet - check again when it could be
+                if self._idle_toast_timer is not None:
+                    self._idle_toast_timer.stop()
+                self._idle_toast_timer = self.set_timer(60 - elapsed + 0.5, self._check_batch_idle_toast)
+                return
+            self._batch_toast_shown = True
+            # Determine provider(s) from run config
+            server_msg = "Your job is processing via batch API."
+            providers = self._get_providers_from_config()
+            if providers and len(providers) == 1:
+                provider_name = next(iter(providers))
+                display_names = {
+                    "gemini": "Google",
+                    "openai": "OpenAI",
+                    "anthropic": "Anthropic",
+                }
+                display = display_names.get(provider_name, provider_name.title())
+                server_msg = f"Your job is running on {display}'s servers."
+            self.notify(
+                f"Batch processing can take several minutes. {server_msg}",
+                timeout=8,
+            )
         except Exception:
             pass
 
+    def _load_manifest_cached(self) -> dict | None:
+        """Load MANIFEST.json, reusing the previous parse while the file is unchanged.
+
+        Keyed on the file's (mtime_ns, size). The returned dict is shared
+        between callers and must be treated as read-only.
+
+        Returns:
+            Parsed manifest, or None if the file doesn't exist
+        """
+        manifest_path = self.run_data.run_dir / "MANIFEST.json"
+        try:
+            stat = manifest_path.stat()
+        except OSError:
+            self._manifest_cache = None
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._manifest_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        manifest = json_io.loads(manifest_path.read_bytes())
+        self._manifest_cache = (key, manifest)
+        return manifest
+
     def _seed_chunk_states(self) -> None:
         """Snapshot current chunk states so the first diff tick doesn't fire spurious events."""
         try:
-            manifest_path = self.run_data.run_dir / "MANIFEST.json"
-            if not manifest_path.exists():
+            manifest = self._load_manifest_cached()
+            if manifest is None:
                 return
-            with open(manifest_path) as f:
-                manifest = json.load(f)
             for name, data in manifest.get("chunks", {}).items():
                 self._previous_chunk_states[name] = data.get("state", "")
                 self._previous_chunk_retries[name] = data.get("retries", 0)
+            self._diffed_manifest = manifest
         except Exception:
             pass
 
-    def _diff_chunk_states(self) -> None:
-        """Compare current manifest chunk states to previous, fire Otto events on changes."""
-        if not self._otto_orchestrator:
+    def _diff_chunk_states(self, manifest: dict) -> None:
+        """Compare current manifest chunk states to previous, fire Otto events on changes.
+
+        Only called from _do_refresh once the refresh signature has changed.
+
+        Args:
+            manifest: The manifest _do_refresh just read
+        """
+        if self._otto_orchestrator is None:
             return
         try:
-            manifest_path = self.run_data.run_dir / "MANIFEST.json"
-            if not manifest_path.exists():
-                return
-            with open(manifest_path) as f:
-                manifest = json.load(f)
 
             run_id = self.run_data.run_name
             manifest_status = manifest.get("status", "")
             chunks = manifest.get("chunks", {})
             had_events = False
 
-            for name, data in chunks.items():
-                state = data.get("state", "")
-                retries = data.get("retries", 0)
-                prev_state = self._previous_chunk_states.get(name, "")
-                prev_retries = self._previous_chunk_retries.get(name, 0)
-
-                if state != prev_state:
+            # The same cached manifest object means no chunk can have changed
+            # since the last diff, so the per-chunk work is skipped
+            if manifest is not self._diffed_manifest:
+                self._diffed_manifest = manifest
+                prev_states = self._previous_chunk_states
+                prev_retries = self._previous_chunk_retries
+                new_states = {name: data.get("state", "") for name, data in chunks.items()}
+                new_retries = {name: data.get("retries", 0) for name, data in chunks.items()}
+
+                # Set difference on the items views yields only changed entries
+                for name, state in new_states.items() - prev_states.items():
+                    prev_state = prev_states.get(name, "")
+                    if state == prev_state:
+                        continue  # new chunk still in the default "" state
                     had_events = True
                     if state == "VALIDATED":
                         self._otto_orchestrator.on_chunk_complete(run_id)
-                    elif prev_state and state != prev_state:
+                    elif prev_state:
                         self._otto_orchestrator.on_chunk_advance(run_id)
 
-                if retries > prev_retries:
-                    had_events = True
-                    self._otto_orchestrator.on_chunk_retry(run_id)
+                for name, retries in new_retries.items() - prev_retries.items():
+                    if retries > prev_retries.get(name, 0):
+                        had_events = True
+                        self._otto_orchestrator.on_chunk_retry(run_id)
 
-                self._previous_chunk_states[name] = state
-                self._previous_chunk_retries[name] = retries
+                self._previous_chunk_states = new_states
+                self._previous_chunk_retries = new_retries
 
             # Run-level completion
-            old_run_status = getattr(self, '_last_manifest_status', None)
+            old_run_status = self._last_manifest_status
             if manifest_status == "complete" and old_run_status == "running":
                 self._otto_orchestrator.on_run_complete(run_id)
                 self.notify(
@@ -1014,7 +1401,7 @@ class MainScreen(Screen):
             # Idle detection
             if manifest_status != "running" and not self._idle_toast_shown:
                 all_terminal = all(
-                    data.get("state", "") in ("VALIDATED", "FAILED")
+                    data.get("state", "") in _TERMINAL_CHUNK_STATES
                     for data in chunks.values()
                 ) if chunks else False
                 if all_terminal and not had_events:
@@ -1026,23 +1413,62 @@ class MainScreen(Screen):
                     )
 
             # Update Otto narrative based on run state and providers
-            providers = self._get_providers_from_config()
-            context = self._build_otto_context(manifest)
-            self._otto_orchestrator.update_narrative(manifest_status, providers, context=context)
+            self._update_otto_narrative(manifest, manifest_status)
 
             self._last_manifest_status = manifest_status
         except Exception:
             pass
 
+    def _update_otto_narrative(self, manifest: dict, manifest_status: str) -> None:
+        """Rebuild the Otto narrative, rate-limited while the status is unchanged.
+
+        The context rebuild scans failure files, so while the status is
+        unchanged it runs at most every _NARRATIVE_MIN_INTERVAL seconds;
+        status changes (e.g. running -> complete) update immediately. A
+        skipped update arms a one-shot timer that applies the latest
+        manifest once the interval is up, so a change followed by a quiet
+        spell isn't lost.
+        """
+        elapsed = time.monotonic() - self._last_narrative_ts
+        if manifest_status == self._last_narrative_status and elapsed < _NARRATIVE_MIN_INTERVAL:
+            if self._narrative_timer is None:
+                self._narrative_timer = self.set_timer(
+                    _NARRATIVE_MIN_INTERVAL - elapsed, self._apply_pending_narrative
+                )
+            return
+        if self._narrative_timer is not None:
+            self._narrative_timer.stop()
+            self._narrative_timer = None
+        providers = self._get_providers_from_config()
+        context = self._build_otto_context(manifest)
+        self._otto_orchestrator.update_narrative(manifest_status, providers, context=context)
+        self._last_narrative_status = manifest_status
+        self._last_narrative_ts = time.monotonic()
+
+    def _apply_pending_narrative(self) -> None:
+        """Timer callback: apply a rate-limited narrative update from the latest manifest."""
+        self._narrative_timer = None
+        if self._otto_orchestrator is None:
+            return
+        try:
+            manifest = self._load_manifest_cached()
+            if manifest is not None:
+                self._update_otto_narrative(manifest, manifest.get("status", ""))
+        except Exception:
+            pass
+
     def _get_providers_from_config(self) -> set[str] | None:
-        """Extract provider names from the run's config.yaml."""
+        """Extract provider names from the run's config.yaml.
+
+        The config snapshot doesn't change during a run, so it is parsed
+        once per screen and the result reused.
+        """
+        if self._providers_cache is not None:
+            return set(self._providers_cache) or None
         providers: set[str] = set()
         try:
-            import yaml
-            config_path = self.run_data.run_dir / "config" / "config.yaml"
-            if config_path.exists():
-                with open(config_path) as cf:
-                    config = yaml.safe_load(cf)
+            config = self._load_run_config()
+            if config:
                 global_provider = config.get("api", {}).get("provider", "")
                 if global_provider:
                     providers.add(global_provider)
@@ -1051,7 +1477,8 @@ class MainScreen(Screen):
                         providers.add(step_cfg["provider"])
         except Exception:
             pass
-        return providers or None
+        self._providers_cache = providers
+        return set(providers) or None
 
     def _build_otto_context(self, manifest: dict) -> dict:
         """Build context dict for Otto narrative from manifest data."""
@@ -1071,9 +1498,7 @@ class MainScreen(Screen):
         # runs that have validation failures in {step}_failures.jsonl files.
         total_failures = 0
         try:
-            for step in self.run_data.steps:
-                counts = self._count_step_failures(step.name)
-                total_failures += counts.get("total", 0)
+            total_failures = self._count_failure_rows([step.name for step in self.run_data.steps])
         except Exception:
             # Fallback: sum manifest chunk failed counts
             for name, data in chunks.items():
@@ -1088,9 +1513,19 @@ class MainScreen(Screen):
     def on_unmount(self) -> None:
         """Stop polling when screen unmounts."""
         self._refresh_active = False  # Stop the refresh loop
+        self._watch_stop.set()
         if self._poll_timer:
             self._poll_timer.stop()
             self._poll_timer = None
+        if self._unit_poll_timer:
+            self._unit_poll_timer.stop()
+            self._unit_poll_timer = None
+        if self._idle_toast_timer:
+            self._idle_toast_timer.stop()
+            self._idle_toast_timer = None
+        if self._narrative_timer:
+            self._narrative_timer.stop()
+            self._narrative_timer = None
 
     def on_screen_suspend(self) -> None:
         """Called when screen is suspended (covered by another screen)."""
@@ -1100,9 +1535,11 @@ class MainScreen(Screen):
         """Restart refresh when screen resumes (e.g., after modal closes)."""
         self._update_terminal_title()
         if not self._refresh_active:
+            # Catch the log ticker up now rather than on the next 2s tick
+            self._update_log_ticker()
             self._refresh_active = True
-            self.set_timer(2.0, self._do_refresh)
-            self.set_timer(5.0, self._do_unit_refresh)
+            self._arm_refresh()
+            self._arm_unit_refresh()
 
     def on_resize(self, event: events.Resize) -> None:
         """Show/hide Otto based on terminal width."""
@@ -1113,21 +1550,30 @@ class MainScreen(Screen):
             pass
 
     def _build_manifest_signature(self, manifest: dict) -> tuple:
-        """Create a compact refresh signature from manifest metadata/chunks."""
+        """Create a compact refresh signature from manifest metadata/chunks.
+
+        _load_manifest_cached hands back the same dict while the file is
+        unchanged, so the signature is memoized on that object.
+        """
+        cached = self._manifest_sig_cache
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+
         chunks = manifest.get("chunks", {})
-        state_counts: dict[str, int] = {}
+        state_counts = Counter()
         total_items = 0
         total_valid = 0
         total_failed = 0
         total_retries = 0
         for chunk in chunks.values():
-            state = chunk.get("state", "")
-            state_counts[state] = state_counts.get(state, 0) + 1
-            total_items += int(chunk.get("items", 0) or 0)
-            total_valid += int(chunk.get("valid", 0) or 0)
-            total_failed += int(chunk.get("failed", 0) or 0)
-            total_retries += int(chunk.get("retries", 0) or 0)
-        return (
+            get = chunk.get
+            state_counts[get("state", "")] += 1
+            total_items += get("items", 0) or 0
+            total_valid += get("valid", 0) or 0
+            total_failed += get("failed", 0) or 0
+            total_retries += get("retries", 0) or 0
+        # Keep in step with _SIG_TOTAL_ITEMS
+        signature = (
             manifest.get("updated"),
             manifest.get("status"),
             len(chunks),
@@ -1137,6 +1583,8 @@ class MainScreen(Screen):
             total_retries,
             tuple(sorted(state_counts.items())),
         )
+        self._manifest_sig_cache = (manifest, signature)
+        return signature
 
     def _read_manifest_for_refresh(self) -> tuple[dict, tuple] | None:
         """Read MANIFEST.json and return manifest plus refresh signature.
@@ -1144,60 +1592,96 @@ class MainScreen(Screen):
         Includes live process status in the signature so PID/process changes
         trigger UI updates even when manifest content is unchanged.
         """
-        manifest_path = self.run_data.run_dir / "MANIFEST.json"
         try:
-            with open(manifest_path) as f:
-                manifest = json.load(f)
+            manifest = self._load_manifest_cached()
         except Exception:
             return None
+        if manifest is None:
+            return None
         manifest_sig = self._build_manifest_signature(manifest)
-        proc = get_run_process_status(self.run_data.run_dir)
+        proc, has_errors = self._probe_process()
         proc_sig = (
             bool(proc.get("alive", False)),
             proc.get("pid"),
             proc.get("source"),
-            bool(has_recent_errors(self.run_data.run_dir)),
+            bool(has_errors),
         )
         return manifest, (manifest_sig, proc_sig)
 
-    def _do_refresh(self) -> None:
+    def _probe_process(self, max_age: float = 1.0) -> tuple[dict, bool]:
+        """Return (process status, has_recent_errors), shared for max_age seconds.
+
+        The refresh signature, log ticker, terminal title and stats panel all
+        ask within the same tick; this keeps it to one PID/log probe.
+        """
+        now = time.monotonic()
+        cached = self._proc_probe_cache
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1], cached[2]
+        run_dir = self.run_data.run_dir
+        proc_status = get_run_process_status(run_dir)
+        has_errors = has_recent_errors(run_dir)
+        self._proc_probe_cache = (now, proc_status, has_errors)
+        return proc_status, has_errors
+
+    def _arm_refresh(self) -> None:
+        """Schedule the next _do_refresh tick, replacing any pending one.
+
+        Keeping the handle means a resume that lands before the old timer
+        fires can't leave two self-rescheduling chains running.
+        """
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+        self._poll_timer = self.set_timer(2.0, self._do_refresh)
+
+    def _arm_unit_refresh(self) -> None:
+        """Schedule the next _do_unit_refresh tick, replacing any pending one."""
+        if self._unit_poll_timer is not None:
+            self._unit_poll_timer.stop()
+        self._unit_poll_timer = self.set_timer(5.0, self._do_unit_refresh)
+
+    def _do_refresh(self, reschedule: bool = True) -> None:
         """Perform refresh and schedule next one.
 
         Cheap work (spinner, log ticker) runs every tick.  Expensive work
         (manifest reload, pipeline panel, stats panel, Otto diff) is gated
         behind a manifest signature check so we skip disk I/O on no-op ticks.
+
+        Args:
+            reschedule: False for out-of-band refreshes (file watcher) so the
+                2s timer chain isn't duplicated.
         """
         if not self._refresh_active:
             return
 
         try:
             # --- Cheap work: always do ---
-            self._spinner_index += 1
+            self._spinner_index = (self._spinner_index + 1) % _SPINNER_LEN
             self._update_log_ticker()
             self._update_header_stats()
 
             # --- Expensive work: only when manifest changed ---
             manifest_refresh = self._read_manifest_for_refresh()
             if manifest_refresh is None:
-                if self._refresh_active:
-                    self.set_timer(2.0, self._do_refresh)
+                if self._refresh_active and reschedule:
+                    self._arm_refresh()
                 return
             manifest, signature = manifest_refresh
             if signature == self._last_manifest_signature:
                 # Nothing changed on disk — reschedule and return early
-                if self._refresh_active:
-                    self.set_timer(2.0, self._do_refresh)
+                if self._refresh_active and reschedule:
+                    self._arm_refresh()
                 return
             self._last_manifest_signature = signature
             self._pending_units_refresh = True
 
             # Track status before reload to detect transitions
-            old_status = getattr(self, '_last_manifest_status', None)
+            old_status = self._last_manifest_status
 
             self._reload_realtime_progress(manifest)  # Reload realtime progress from manifest
 
             # For running runs, reload RunData so step states stay current
-            if getattr(self, '_last_manifest_status', None) == "running":
+            if self._last_manifest_status == "running":
                 try:
                     self.run_data = load_run_data(self.run_data.run_dir)
                 except Exception:
@@ -1205,11 +1689,11 @@ class MainScreen(Screen):
 
             self._update_pipeline_panel()  # Refresh pipeline boxes for live progress
             self._update_run_stats_panel()
-            self._diff_chunk_states()  # Fire Otto animations for state changes
+            self._diff_chunk_states(manifest)  # Fire Otto animations for state changes
 
             # Detect transition to terminal state (running -> complete/failed)
             # (Terminal title is synced inside _update_run_stats_panel above.)
-            new_status = getattr(self, '_last_manifest_status', None)
+            new_status = self._last_manifest_status
             had_transition = old_status == "running" and new_status in ("complete", "failed")
             if had_transition:
                 # Run just finished - force full reload from disk
@@ -1230,8 +1714,33 @@ class MainScreen(Screen):
             pass  # Silently ignore refresh errors
 
         # Schedule next refresh if still active
+        if self._refresh_active and reschedule:
+            self._arm_refresh()
+
+    @work(thread=True, exclusive=True, group="main-screen-watch")
+    def _watch_run_dir(self) -> None:
+        """Refresh as soon as the manifest or unit output files change.
+
+        Only runs when watchfiles is installed. The 2s timer keeps running
+        for process status and the spinner; this just removes the wait for
+        the next tick after the orchestrator writes. Set
+        WATCHFILES_FORCE_POLLING=1 for network filesystems without inotify.
+        """
+        try:
+            for _changes in watch_files(
+                self.run_data.run_dir,
+                watch_filter=_is_refresh_trigger,
+                debounce=300,
+                stop_event=self._watch_stop,
+            ):
+                self.app.call_from_thread(self._on_run_files_changed)
+        except Exception as e:
+            _log.debug(f"File watcher stopped: {e}")
+
+    def _on_run_files_changed(self) -> None:
+        """Handle a watcher event on the main thread."""
         if self._refresh_active:
-            self.set_timer(2.0, self._do_refresh)
+            self._do_refresh(reschedule=False)
 
     def _do_unit_refresh(self) -> None:
         """Refresh units from disk for running runs (5s interval, threaded).
@@ -1240,21 +1749,25 @@ class MainScreen(Screen):
         """
         if not self._refresh_active:
             return
-        status = getattr(self, '_last_manifest_status', None)
+        status = self._last_manifest_status
         if status == "running" and self.current_view == "unit" and not self._units_loading:
             if self._pending_units_refresh:
                 self._pending_units_refresh = False
                 self._units_loaded = False
                 self._start_unit_load()
         if self._refresh_active:
-            self.set_timer(5.0, self._do_unit_refresh)
+            self._arm_unit_refresh()
 
     def _clear_unit_cache(self) -> None:
         """Explicitly clear large lists before reloads for memory hygiene."""
+        self._filtered_cache = {}
+        self._jsonl_rows_cache = {}
         self._all_units.clear()
         self._filtered_units.clear()
+        self._unit_tree_spec_cache.clear()
         self._all_units = []
         self._filtered_units = []
+        self._unit_status_counts = Counter()
         self._units_loaded = False
 
     def _start_unit_load(self) -> None:
@@ -1283,9 +1796,12 @@ class MainScreen(Screen):
             self._clear_unit_cache()
             self._start_unit_load()
             return
+        self._filtered_cache = {}
         self._all_units.clear()
         self._filtered_units.clear()
+        self._unit_tree_spec_cache.clear()
         self._all_units = units
+        self._unit_status_counts = Counter(u["status"] for u in units)
         self._units_loaded = True
         self._unique_steps = (
             list(self.run_data.pipeline)
@@ -1306,11 +1822,9 @@ class MainScreen(Screen):
         """
         try:
             if manifest is None:
-                manifest_path = self.run_data.run_dir / "MANIFEST.json"
-                if not manifest_path.exists():
-                    return
-                with open(manifest_path) as f:
-                    manifest = json.load(f)
+                manifest = self._load_manifest_cached()
+            if manifest is None:
+                return
 
             # Check for status change that requires full reload
             # (e.g., failed run restarted, or running run completed)
@@ -1325,7 +1839,7 @@ class MainScreen(Screen):
                     needs_full_reload = True
 
             # Also reload if status changed to/from terminal states
-            old_status = getattr(self, '_last_manifest_status', None)
+            old_status = self._last_manifest_status
             if old_status is not None and old_status != manifest_status:
                 needs_full_reload = True
             self._last_manifest_status = manifest_status
@@ -1355,14 +1869,35 @@ class MainScreen(Screen):
         except Exception:
             pass  # Silently ignore errors
 
+    def _load_run_config(self) -> dict | None:
+        """Parse the run's config/config.yaml snapshot once per screen.
+
+        The snapshot is written when the run starts and is not modified
+        afterwards, so the parsed dict is kept for the screen's lifetime.
+        Uses libyaml's CSafeLoader when PyYAML was built with it.
+
+        Returns:
+            Parsed config (shared, read-only), or None if missing/unreadable
+        """
+        if self._run_config_loaded:
+            return self._run_config
+        self._run_config_loaded = True
+        config_path = self.run_data.run_dir / "config" / "config.yaml"
+        try:
+            import yaml
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(config_path) as f:
+                config = yaml.load(f, Loader=loader)
+            self._run_config = config if isinstance(config, dict) else None
+        except Exception:
+            self._run_config = None
+        return self._run_config
+
     def _load_step_descriptions(self) -> None:
         """Load step descriptions from the run's config snapshot (once at mount)."""
         try:
-            config_path = self.run_data.run_dir / "config" / "config.yaml"
-            if config_path.exists():
-                import yaml
-                with open(config_path) as f:
-                    config = yaml.safe_load(f)
+            config = self._load_run_config()
+            if config:
                 for step_cfg in config.get("pipeline", {}).get("steps", []):
                     if isinstance(step_cfg, dict):
                         name = step_cfg.get("name", "")
@@ -1449,9 +1984,9 @@ class MainScreen(Screen):
             "running": "running",
             "stuck": "stuck",
             "process_lost": "process lost",
-            "not_running": getattr(self, '_last_manifest_status', '') or 'unknown',
+            "not_running": self._last_manifest_status or 'unknown',
         }
-        status = status_map.get(proc_info["status"], getattr(self, '_last_manifest_status', '') or 'unknown')
+        status = status_map.get(proc_info["status"], self._last_manifest_status or 'unknown')
         pipeline = self.run_data.pipeline_name or self.run_data.run_name
         title = f"Octobatch v{__version__} \u2013 {pipeline} pipeline ({status})"
         if self.app.screen is self:
@@ -1470,11 +2005,10 @@ class MainScreen(Screen):
             status_label = f"F:{self.status_filter[:3]}"
             sort_label = f"S:{self.sort_by[:4]}"
             # Count retryable (validation) failures for retry hint
-            _val_stages = {"schema_validation", "validation"}
             retryable_count = sum(
                 1 for u in self._filtered_units
                 if u.get("status") == "failed"
-                and u.get("failure_stage", "validation") in _val_stages
+                and u.get("failure_stage", "validation") in _VALIDATION_STAGES
             )
             retry_hint = f"R:retry({retryable_count})" if retryable_count > 0 else ""
             return f"←→:step  ↑↓:select  Enter:detail  {status_label}  {sort_label}  {retry_hint}  G:report  T:troubleshoot  A:files  D:diag  V:chunks  Esc:back  Q:quit"
@@ -1483,19 +2017,7 @@ class MainScreen(Screen):
 
     def _parse_step_from_state(self, state: str) -> str | None:
         """Extract step name from chunk state like 'generate_SUBMITTED'."""
-        if not state:
-            return None
-
-        # States look like: generate_SUBMITTED, score_coherence_PENDING, VALIDATED
-        if state in ("VALIDATED", "PENDING", "FAILED"):
-            return None
-
-        # Remove the status suffix
-        for suffix in ["_SUBMITTED", "_PENDING", "_COMPLETE"]:
-            if state.endswith(suffix):
-                return state[:-len(suffix)]
-
-        return None
+        return _step_from_chunk_state(state)
 
     def _load_pending_units_for_chunk(
         self,
@@ -1524,56 +2046,39 @@ class MainScreen(Screen):
 
         # Try batch input file first
         input_file = chunk_dir / f"{current_step}_input.jsonl"
-        if input_file.exists():
-            try:
-                with _open_jsonl(input_file) as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-                            unit_id = self._extract_unit_id_from_batch_request(data)
-                            if unit_id and unit_id not in completed_unit_ids:
-                                pending_units.append({
-                                    "unit_id": unit_id,
-                                    "step": current_step,
-                                    "status": status,
-                                    "data": None,
-                                    "errors": None,
-                                    "attempts": 0,
-                                })
-                        except json.JSONDecodeError:
-                            continue
-            except Exception as e:
-                _log.debug(f"Error reading {input_file}: {e}")
+        try:
+            with _jsonl_lines(input_file) as lines:
+                unit_ids = [self._extract_unit_id_from_batch_request(d) for d in _iter_json_rows(lines)]
+            pending_units = [
+                {"unit_id": unit_id, "step": current_step, "status": status,
+                 "data": None, "errors": None, "attempts": 0}
+                for unit_id in unit_ids
+                if unit_id and isinstance(unit_id, str) and unit_id not in completed_unit_ids
+            ]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _log.debug(f"Error reading {input_file}: {e}")
 
-            if pending_units:
-                return pending_units
+        if pending_units:
+            return pending_units
 
         # Try prompts file
         prompts_file = chunk_dir / f"{current_step}_prompts.jsonl"
-        if prompts_file.exists():
-            try:
-                with _open_jsonl(prompts_file) as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-                            unit_id = data.get("unit_id", "unknown")
-                            if unit_id not in completed_unit_ids:
-                                pending_units.append({
-                                    "unit_id": unit_id,
-                                    "step": current_step,
-                                    "status": status,
-                                    "data": data,
-                                    "errors": None,
-                                    "attempts": 0,
-                                })
-                        except json.JSONDecodeError:
-                            continue
-            except Exception as e:
-                _log.debug(f"Error reading {prompts_file}: {e}")
+        try:
+            with _jsonl_lines(prompts_file) as lines:
+                rows = list(_iter_json_rows(lines))
+            pending_units = [
+                {"unit_id": unit_id, "step": current_step, "status": status,
+                 "data": data, "errors": None, "attempts": 0}
+                for data in rows
+                if isinstance(unit_id := data.get("unit_id", "unknown"), str)
+                and unit_id not in completed_unit_ids
+            ]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _log.debug(f"Error reading {prompts_file}: {e}")
 
         return pending_units
 
@@ -1590,16 +2095,16 @@ class MainScreen(Screen):
         return data.get("unit_id")
 
     def _get_manifest_total_items(self) -> int:
-        """Get total expected items from manifest chunk data."""
-        manifest_path = self.run_data.run_dir / "MANIFEST.json"
-        if not manifest_path.exists():
-            return 0
+        """Get total expected items from manifest chunk data.
+
+        Reads the total from the refresh signature, which is memoized per
+        cached manifest, so this neither re-reads nor re-sums the chunks.
+        """
         try:
-            manifest = json.loads(manifest_path.read_text())
-            return sum(
-                chunk.get("items", 0)
-                for chunk in manifest.get("chunks", {}).values()
-            )
+            manifest = self._load_manifest_cached()
+            if manifest is None:
+                return 0
+            return self._build_manifest_signature(manifest)[_SIG_TOTAL_ITEMS]
         except Exception:
             return 0
 
@@ -1608,6 +2113,127 @@ class MainScreen(Screen):
         visible_rows = max(20, self.size.height - 16)
         return min(1200, max(120, visible_rows * 4))
 
+    def _list_chunk_dirs(self, chunks_dir: Path, prefix: str = "") -> list[Path]:
+        """List subdirectories of chunks/ whose names start with prefix.
+
+        Uses os.scandir so the directory check comes from the listing itself
+        rather than a stat per entry, and reuses the listing until the
+        directory's st_mtime_ns moves (a chunk or retry dir is added or
+        removed). As in _list_chunk_files, a listing taken within
+        _RACY_MTIME_NS of that mtime is redone next time. A missing
+        directory yields [].
+        """
+        key = (chunks_dir, prefix)
+        try:
+            mtime_ns = os.stat(chunks_dir).st_mtime_ns
+        except OSError:
+            self._chunk_dirs_cache.pop(key, None)
+            return []
+        cached = self._chunk_dirs_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns and cached[2]:
+            return cached[1]
+        trusted = time.time_ns() - mtime_ns >= _RACY_MTIME_NS
+        try:
+            with os.scandir(chunks_dir) as entries:
+                dirs = [
+                    Path(e.path) for e in entries
+                    if e.name.startswith(prefix) and e.is_dir()
+                ]
+        except OSError:
+            dirs = []
+        self._chunk_dirs_cache[key] = (mtime_ns, dirs, trusted)
+        return dirs
+
+    def _list_chunk_files(self, chunk_dir: Path) -> frozenset[str]:
+        """Return the file names in a chunk directory, listed once per change.
+
+        Keyed on the directory's st_mtime_ns, which moves whenever an entry
+        is created, removed or renamed (including atomic tmp+replace
+        writes), so lookups cost one stat instead of a stat per candidate.
+        A listing taken within _RACY_MTIME_NS of that mtime is redone on the
+        next lookup, since a file created in the same timestamp tick would
+        not have moved it.
+        """
+        try:
+            mtime_ns = os.stat(chunk_dir).st_mtime_ns
+        except OSError:
+            self._chunk_files_cache.pop(chunk_dir, None)
+            return frozenset()
+        cached = self._chunk_files_cache.get(chunk_dir)
+        if cached is not None and cached[0] == mtime_ns and cached[2]:
+            return cached[1]
+        trusted = time.time_ns() - mtime_ns >= _RACY_MTIME_NS
+        try:
+            with os.scandir(chunk_dir) as entries:
+                names = frozenset(e.name for e in entries if e.is_file())
+        except OSError:
+            names = frozenset()
+        self._chunk_files_cache[chunk_dir] = (mtime_ns, names, trusted)
+        return names
+
+    def _find_chunk_jsonl(self, chunk_dir: Path, name: str) -> Path | None:
+        """Like _find_jsonl_file, but matched against the cached chunk listing."""
+        names = self._list_chunk_files(chunk_dir)
+        if name in names:
+            return chunk_dir / name
+        if name + ".gz" in names:
+            return chunk_dir / (name + ".gz")
+        return None
+
+    def _read_jsonl_rows_cached(self, path: Path, limit: int) -> list[dict]:
+        """Return the first `limit` rows of a results JSONL file.
+
+        Parsing stops once `limit` rows are in hand. The cache keeps the rows
+        read so far and the offset they end at, so a file that only grew
+        (same 64-byte check as _fold_jsonl), or a later call asking for more
+        rows, continues from that offset. An unchanged (mtime_ns, size) with
+        enough rows doesn't open the file. Rewrites, truncation and .gz files
+        start over. Malformed lines are skipped. Unit-loader worker only.
+
+        Returns:
+            Up to `limit` parsed rows
+        """
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._jsonl_rows_cache.get(path)
+        if cached is not None and cached[0] == signature and (cached[4] or len(cached[3]) >= limit):
+            return cached[3][:limit]
+
+        if path.suffix == ".gz":
+            rows = []
+            at_eof = True
+            with _jsonl_lines(path) as lines:
+                for row in _iter_json_rows(lines):
+                    if len(rows) >= limit:
+                        at_eof = False
+                        break
+                    rows.append(row)
+            self._jsonl_rows_cache[path] = (signature, 0, b"", rows, at_eof)
+            return rows
+
+        with open(path, "rb") as f:
+            offset, rows = 0, []
+            if cached is not None and stat.st_size >= cached[1]:
+                _, cached_offset, check, cached_rows, _ = cached
+                f.seek(cached_offset - len(check))
+                if f.read(len(check)) == check:
+                    offset, rows = cached_offset, list(cached_rows)
+            f.seek(offset)
+            at_eof = False
+            if len(rows) < limit:
+                at_eof = True
+                for end, row in _iter_jsonl_from(f):
+                    if row is not None:
+                        if len(rows) >= limit:
+                            at_eof = False
+                            break
+                        rows.append(row)
+                    offset = end
+            f.seek(max(0, offset - 64))
+            check = f.read(offset - f.tell())
+        self._jsonl_rows_cache[path] = (signature, offset, check, rows, at_eof)
+        return rows[:limit]
+
     def _load_all_units(self, step_name: str | None = None) -> list[dict]:
         """Load units from manifest and result files for a specific step.
 
@@ -1624,12 +2250,11 @@ class MainScreen(Screen):
 
         # Load manifest to get chunk info
         manifest_path = run_dir / "MANIFEST.json"
-        if not manifest_path.exists():
+        try:
+            manifest = json_io.loads(manifest_path.read_bytes())
+        except FileNotFoundError:
             _log.debug(f"No manifest found at {manifest_path}")
             return units
-
-        try:
-            manifest = json.loads(manifest_path.read_text())
         except Exception as e:
             _log.debug(f"Error reading manifest: {e}")
             return units
@@ -1640,6 +2265,8 @@ class MainScreen(Screen):
 
         # Track completed unit IDs per chunk to avoid duplicates
         capped = False
+        rows_cache = self._jsonl_rows_cache
+        read_paths: set[Path] = set()
         for chunk_name, chunk_data in manifest.get("chunks", {}).items():
             if capped:
                 break
@@ -1654,30 +2281,28 @@ class MainScreen(Screen):
                 if capped:
                     break
                 # Check for validated results
-                validated_path = _find_jsonl_file(chunk_dir / f"{step}_validated.jsonl")
+                validated_path = self._find_chunk_jsonl(chunk_dir, f"{step}_validated.jsonl")
                 if validated_path:
                     try:
-                        with _open_jsonl(validated_path) as f:
-                            for line in f:
-                                if len(units) >= cap:
-                                    capped = True
-                                    break
-                                if line.strip():
-                                    try:
-                                        data = json.loads(line)
-                                        unit_id = data.get("unit_id", "unknown")
-                                        completed_unit_ids.add(unit_id)
-                                        units.append({
-                                            "unit_id": unit_id,
-                                            "chunk": chunk_name,
-                                            "step": step,
-                                            "status": "valid",
-                                            "data": data,
-                                            "errors": None,
-                                            "attempts": data.get("retry_count", 0) + 1,
-                                        })
-                                    except json.JSONDecodeError:
-                                        continue
+                        remaining = cap - len(units)
+                        # One row past the budget tells us whether we're capped
+                        rows = self._read_jsonl_rows_cached(validated_path, remaining + 1)
+                        read_paths.add(validated_path)
+                        if len(rows) > remaining:
+                            capped = True
+                            rows = rows[:remaining]
+                        for data in rows:
+                            unit_id = data.get("unit_id", "unknown")
+                            completed_unit_ids.add(unit_id)
+                            units.append({
+                                "unit_id": unit_id,
+                                "chunk": chunk_name,
+                                "step": step,
+                                "status": "valid",
+                                "data": data,
+                                "errors": None,
+                                "attempts": data.get("retry_count", 0) + 1,
+                            })
                     except Exception as e:
                         _log.debug(f"Error reading {validated_path}: {e}")
 
@@ -1685,73 +2310,98 @@ class MainScreen(Screen):
                     break
 
                 # Check for failed results
-                failures_path = _find_jsonl_file(chunk_dir / f"{step}_failures.jsonl")
+                failures_path = self._find_chunk_jsonl(chunk_dir, f"{step}_failures.jsonl")
                 if failures_path:
                     try:
-                        with _open_jsonl(failures_path) as f:
-                            for line in f:
-                                if len(units) >= cap:
-                                    capped = True
-                                    break
-                                if line.strip():
-                                    try:
-                                        data = json.loads(line)
-                                        unit_id = data.get("unit_id", "unknown")
-                                        completed_unit_ids.add(unit_id)
-                                        units.append({
-                                            "unit_id": unit_id,
-                                            "chunk": chunk_name,
-                                            "step": step,
-                                            "status": "failed",
-                                            "data": data.get("input", data),
-                                            "raw_response": data.get("raw_response"),  # LLM output that failed validation
-                                            "errors": data.get("errors", []),
-                                            "failure_stage": data.get("failure_stage", "unknown"),
-                                            "attempts": data.get("retry_count", 0) + 1,
-                                        })
-                                    except json.JSONDecodeError:
-                                        continue
+                        remaining = cap - len(units)
+                        # One row past the budget tells us whether we're capped
+                        rows = self._read_jsonl_rows_cached(failures_path, remaining + 1)
+                        read_paths.add(failures_path)
+                        if len(rows) > remaining:
+                            capped = True
+                            rows = rows[:remaining]
+                        for data in rows:
+                            unit_id = data.get("unit_id", "unknown")
+                            completed_unit_ids.add(unit_id)
+                            units.append({
+                                "unit_id": unit_id,
+                                "chunk": chunk_name,
+                                "step": step,
+                                "status": "failed",
+                                "data": data.get("input", data),
+                                "raw_response": data.get("raw_response"),  # LLM output that failed validation
+                                "errors": data.get("errors", []),
+                                "failure_stage": data.get("failure_stage", "unknown"),
+                                "attempts": data.get("retry_count", 0) + 1,
+                            })
                     except Exception as e:
                         _log.debug(f"Error reading {failures_path}: {e}")
 
             # For chunks that are in-progress or pending, load from batch/prompt files (not units.jsonl)
             # units.jsonl may contain ALL permutations, but we only want the actual limited set
             # Only load pending units if the chunk's current step matches what we're loading
-            if not capped and chunk_state not in ("VALIDATED", "FAILED") and chunk_dir.exists() and current_step:
+            if not capped and chunk_state not in _TERMINAL_CHUNK_STATES and current_step:
                 if step_name is None or current_step == step_name:
                     pending_units = self._load_pending_units_for_chunk(
                         chunk_dir, current_step, chunk_state, completed_unit_ids
                     )
+                    remaining = cap - len(units)
+                    if len(pending_units) > remaining:
+                        capped = True
+                        pending_units = pending_units[:remaining]
                     for pu in pending_units:
-                        if len(units) >= cap:
-                            capped = True
-                            break
                         pu["chunk"] = chunk_name
                         units.append(pu)
 
+        # Keep only the files this load read so rows from other steps don't
+        # pile up (unless _clear_unit_cache already swapped the cache out)
+        if self._jsonl_rows_cache is rows_cache:
+            self._jsonl_rows_cache = {p: rows_cache[p] for p in read_paths if p in rows_cache}
+
         _log.debug(f"Loaded {len(units)} units for step={step_name or 'all'} (capped={capped})")
         return units
 
     def _get_filtered_units(self) -> list[dict]:
-        """Get filtered and sorted units for display."""
-        units = self._all_units
+        """Get filtered and sorted units for display.
+
+        Results are kept per (status, step, sort) combination until the unit
+        list is reloaded (both reload paths reset _filtered_cache), so cycling
+        F/S back to an earlier setting is a dict lookup. A status filter is
+        applied to the cached unfiltered list for the same sort, since
+        filtering preserves order and the sort is the expensive part.
+        """
+        cache = self._filtered_cache
+        key = (self.status_filter, self.step_filter, self.sort_by)
+        units = cache.get(key)
+        if units is not None:
+            return units
 
-        # Apply status filter
         if self.status_filter != "all":
-            units = [u for u in units if u["status"] == self.status_filter]
+            base = cache.get(("all", self.step_filter, self.sort_by))
+            if base is None:
+                base = self._sort_units(self._all_units)
+                cache[("all", self.step_filter, self.sort_by)] = base
+            units = [u for u in base if u["status"] == self.status_filter]
+        else:
+            units = self._sort_units(self._all_units)
+        cache[key] = units
+        return units
 
+    def _sort_units(self, units: list[dict]) -> list[dict]:
+        """Apply the step filter and current sort order to a unit list."""
         # Apply step filter
         if self.step_filter != "all":
             units = [u for u in units if u["step"] == self.step_filter]
 
         # Apply sort
         if self.sort_by == "status":
-            units = sorted(units, key=lambda u: (0 if u["status"] == "failed" else 1, u["unit_id"]))
+            # Stable sort: order by unit_id first, then pull failed rows forward
+            units = sorted(units, key=_UNIT_ID_KEY)
+            units.sort(key=lambda u: u["status"] != "failed")
         elif self.sort_by == "step":
-            units = sorted(units, key=lambda u: (u["step"], u["unit_id"]))
+            units = sorted(units, key=_STEP_UNIT_KEY)
         else:  # unit_id
-            units = sorted(units, key=lambda u: u["unit_id"])
-
+            units = sorted(units, key=_UNIT_ID_KEY)
         return units
 
     # --- View Watchers ---
@@ -1769,11 +2419,13 @@ class MainScreen(Screen):
             # Clear cached units so they reload scoped to the new step
             self._clear_unit_cache()
 
-        self._update_pipeline_panel()
-        self._update_detail_panel()
-        self._update_run_stats_panel()
-        self._update_chunk_stats_panel()
-        self._update_footer()
+        # One batched repaint per keypress instead of one per panel
+        with self.app.batch_update():
+            self._update_pipeline_panel()
+            self._update_detail_panel()
+            self._update_run_stats_panel()
+            self._update_chunk_stats_panel()
+            self._update_footer()
 
     def watch_active_focus(self, new_focus: str) -> None:
         """Update visual focus indicators."""
@@ -1795,9 +2447,10 @@ class MainScreen(Screen):
     def watch_current_view(self, new_view: str) -> None:
         """Update when view changes between chunk and unit."""
         _log.debug(f"watch_current_view: {new_view}")
-        self._update_detail_panel()
-        self._update_chunk_stats_panel()
-        self._update_footer()
+        with self.app.batch_update():
+            self._update_detail_panel()
+            self._update_chunk_stats_panel()
+            self._update_footer()
 
     # --- Panel Updates ---
 
@@ -1811,14 +2464,11 @@ class MainScreen(Screen):
 
     def _get_process_status(self) -> dict:
         """Get current process status for this run."""
-        proc_status = get_run_process_status(self.run_data.run_dir)
-        has_errors = has_recent_errors(self.run_data.run_dir)
+        proc_status, has_errors = self._probe_process()
         manifest_status = None
         try:
-            manifest_path = self.run_data.run_dir / "MANIFEST.json"
-            if manifest_path.exists():
-                with open(manifest_path) as f:
-                    manifest = json.load(f)
+            manifest = self._load_manifest_cached()
+            if manifest is not None:
                 manifest_status = manifest.get("status")
         except Exception:
             manifest_status = None
@@ -1875,10 +2525,8 @@ class MainScreen(Screen):
         fan_out_warning = ""
         if self.run_data and self.run_data.run_dir:
             try:
-                manifest_path = self.run_data.run_dir / "MANIFEST.json"
-                if manifest_path.exists():
-                    with open(manifest_path) as f:
-                        _manifest = json.load(f)
+                _manifest = self._load_manifest_cached()
+                if _manifest is not None:
                     if _manifest.get("metadata", {}).get("has_fan_out"):
                         fan_out_warning = "\n[bold yellow]⚠ Fan-out pipeline: costs may be higher than estimate[/]"
             except Exception:
@@ -1940,7 +2588,7 @@ Mode:          {mode_display}{max_units_str}{fan_out_warning}
             content += "[yellow]Errors in log[/]\n"
             content += "[dim]Press I for details[/]\n"
         elif proc_info["status"] == "running":
-            spinner = SPINNER_FRAMES[self._spinner_index % len(SPINNER_FRAMES)]
+            spinner = SPINNER_FRAMES[self._spinner_index]
             content += f"[green]{spinner} RUNNING[/]\n"
             if proc_info["pid"]:
                 content += f"PID: {proc_info['pid']}\n"
@@ -1997,11 +2645,8 @@ Mode:          {mode_display}{max_units_str}{fan_out_warning}
             config = None
             step_config = None
             try:
-                config_path = self.run_data.run_dir / "config" / "config.yaml"
-                if config_path.exists():
-                    import yaml
-                    with open(config_path) as f:
-                        config = yaml.safe_load(f)
+                config = self._load_run_config()
+                if config:
                     step_configs = config.get("pipeline", {}).get("steps", [])
                     if self.selected_step_index < len(step_configs):
                         step_config = step_configs[self.selected_step_index]
@@ -2073,26 +2718,17 @@ Passed:        {passed}
                 # Calculate average iterations from validated output
                 try:
                     chunks_dir = self.run_data.run_dir / "chunks"
-                    if chunks_dir.exists():
-                        iterations_list = []
-                        for chunk_dir in chunks_dir.glob("chunk_*"):
-                            if not chunk_dir.is_dir():
-                                continue
-                            validated_path = _find_jsonl_file(chunk_dir / f"{step.name}_validated.jsonl")
-                            if validated_path:
-                                with _open_jsonl(validated_path) as f:
-                                    for line in f:
-                                        if line.strip():
-                                            try:
-                                                record = json.loads(line)
-                                                iters = record.get("_metadata", {}).get("iterations")
-                                                if iters is not None:
-                                                    iterations_list.append(iters)
-                                            except json.JSONDecodeError:
-                                                pass
-                        if iterations_list:
-                            avg_iters = sum(iterations_list) / len(iterations_list)
-                            content += f"  Avg Iters: [green]{avg_iters:.1f}[/]\n"
+                    iters_total = 0
+                    iters_count = 0
+                    for chunk_dir in self._list_chunk_dirs(chunks_dir, "chunk_"):
+                        validated_path = self._find_chunk_jsonl(chunk_dir, f"{step.name}_validated.jsonl")
+                        if validated_path:
+                            stats = self._validated_file_stats(validated_path)
+                            iters_total += stats["iters_total"]
+                            iters_count += stats["iters_count"]
+                    if iters_count:
+                        avg_iters = iters_total / iters_count
+                        content += f"  Avg Iters: [green]{avg_iters:.1f}[/]\n"
                 except Exception:
                     pass
 
@@ -2163,24 +2799,38 @@ Passed:        {passed}
         """Get the most recently processed unit ID from the last log line.
 
         Parses lines like: [14:30:15] [5/20] unit_name ✓ ...
-        Returns the unit_id or empty string.
+        Returns the unit_id or empty string. The answer is cached on the
+        log's (size, mtime_ns), so an idle log costs one stat.
         """
+        log_file = self.run_data.run_dir / "RUN_LOG.txt"
+        try:
+            st = os.stat(log_file)
+        except OSError:
+            return ""
+        key = (st.st_size, st.st_mtime_ns)
+        cached = self._log_unit_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        unit_id = self._read_current_unit_from_log(log_file)
+        self._log_unit_cache = (key, unit_id)
+        return unit_id
+
+    @staticmethod
+    def _read_current_unit_from_log(log_file: Path) -> str:
+        """Scan the last 2 KB of RUN_LOG.txt for the newest unit progress line."""
         try:
-            log_file = self.run_data.run_dir / "RUN_LOG.txt"
-            if not log_file.exists():
-                return ""
             with open(log_file, "rb") as f:
                 f.seek(0, 2)
                 file_size = f.tell()
                 read_size = min(2048, file_size)
                 f.seek(max(0, file_size - read_size))
-                content = f.read().decode("utf-8", errors="replace")
-            lines = content.strip().split("\n")
-            # Search from the end for a line with [N/M] pattern
-            for line in reversed(lines):
-                match = re.search(r'\[\d+/\d+\]\s+(\S+)\s+[✓✗]', line)
+                content = f.read()
+            # Search from the end for a line with [N/M] pattern; only the
+            # matched unit id is decoded.
+            for raw_line in reversed(content.split(b"\n")):
+                match = _UNIT_LOG_RE.search(raw_line)
                 if match:
-                    unit_id = match.group(1)
+                    unit_id = match.group(1).decode("utf-8", errors="replace")
                     if len(unit_id) > 30:
                         unit_id = unit_id[:27] + "..."
                     return unit_id
@@ -2190,15 +2840,10 @@ Passed:        {passed}
 
     def _calculate_projections(self, current_cost: float) -> dict:
         """Calculate projected cost and time based on current progress."""
-        run_dir = self.run_data.run_dir
-        manifest_path = run_dir / "MANIFEST.json"
-
-        if not manifest_path.exists():
-            return {}
-
         try:
-            with open(manifest_path) as f:
-                manifest = json.load(f)
+            manifest = self._load_manifest_cached()
+            if manifest is None:
+                return {}
 
             manifest_status = manifest.get("status", "")
 
@@ -2266,17 +2911,27 @@ Passed:        {passed}
         return format_eta(seconds)
 
     def _calculate_cost_from_manifest(self) -> tuple[float, int]:
-        """Calculate cost from manifest token counts."""
-        run_dir = self.run_data.run_dir
-        manifest_path = run_dir / "MANIFEST.json"
+        """Calculate cost from manifest token counts.
 
-        if not manifest_path.exists():
+        Memoized on the cached manifest object, so the models.yaml pricing
+        lookup only runs when MANIFEST.json changes.
+        """
+        try:
+            manifest = self._load_manifest_cached()
+        except Exception:
+            return (0.0, 0)
+        if manifest is None:
             return (0.0, 0)
+        cached = self._cost_cache
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+        result = self._compute_cost(manifest)
+        self._cost_cache = (manifest, result)
+        return result
 
+    def _compute_cost(self, manifest: dict) -> tuple[float, int]:
+        """Price a manifest's token counts using the models.yaml registry."""
         try:
-            with open(manifest_path) as f:
-                manifest = json.load(f)
-
             # Get tokens from metadata
             metadata = manifest.get("metadata", {})
             input_tokens = metadata.get("initial_input_tokens", 0) + metadata.get("retry_input_tokens", 0)
@@ -2396,9 +3051,7 @@ Passed:        {passed}
                 else:
                     errors_display = str(chunk.failed)
 
-                content = f"""[bold]Chunk Stats[/]
-\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500
-{chunk.name}
+                content = _CHUNK_STATS_HEADER + f"""{chunk.name}
 Units:         {chunk.valid}/{chunk.total}
 Status:        {symbol} {step_display}
 Errors:        {errors_display}
@@ -2407,20 +3060,17 @@ Errors:        {errors_display}
                 content = "[dim]No chunk selected[/]"
         else:
             # Unit view - show manifest totals plus current cached row window.
-            manifest_total = sum(c.total for c in self.run_data.chunks)
-            manifest_valid = sum(c.valid for c in self.run_data.chunks)
-            manifest_failed = sum(c.failed for c in self.run_data.chunks)
+            manifest_total, manifest_valid, manifest_failed = self._chunk_totals()
             progress_pct = int((manifest_valid / manifest_total) * 100) if manifest_total > 0 else 0
             total = len(self._all_units)
-            valid_count = sum(1 for u in self._all_units if u["status"] == "valid")
-            failed_count = sum(1 for u in self._all_units if u["status"] == "failed")
+            status_counts = self._unit_status_counts
+            valid_count = status_counts["valid"]
+            failed_count = status_counts["failed"]
             pending_count = max(0, manifest_total - manifest_valid - manifest_failed)
-            processing_count = sum(1 for u in self._all_units if u["status"] == "processing")
+            processing_count = status_counts["processing"]
             showing = len(self._filtered_units)
 
-            content = f"""[bold]Unit Stats[/]
-\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500
-Manifest:      {manifest_valid}/{manifest_total} ({progress_pct}%)
+            content = _UNIT_STATS_HEADER + f"""Manifest:      {manifest_valid}/{manifest_total} ({progress_pct}%)
 Cached rows:   {showing}/{total}
 [green]Valid:[/]         {valid_count}
 [red]Failed:[/]        {failed_count}"""
@@ -2431,17 +3081,36 @@ Cached rows:   {showing}/{total}
 [dim]Pending:[/]       {pending_count}
 [yellow]Processing:[/]   {processing_count}"""
 
-            content += f"""
-
-[bold]Filters[/]
-\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500
-Status (F):    {self.status_filter}
+            content += _FILTERS_HEADER + f"""Status (F):    {self.status_filter}
 Step (←→):     {self.step_filter}
 Sort (S):      {self.sort_by}
 """
 
+        if content == self._last_chunk_stats_content:
+            return  # Unchanged — skip the markup parse and repaint
+        self._last_chunk_stats_content = content
         panel.update(content)
 
+    def _chunk_totals(self) -> tuple[int, int, int]:
+        """Return (total, valid, failed) summed over run_data.chunks.
+
+        load_run_data builds a fresh chunk list on every reload and nothing
+        edits it afterwards, so the sums are memoized on the list object.
+        """
+        chunks = self.run_data.chunks
+        cached = self._chunk_totals_cache
+        if cached is not None and cached[0] is chunks:
+            return cached[1]
+        totals = (0, 0, 0)
+        if chunks:
+            totals = (
+                sum(c.total for c in chunks),
+                sum(c.valid for c in chunks),
+                sum(c.failed for c in chunks),
+            )
+        self._chunk_totals_cache = (chunks, totals)
+        return totals
+
     def _update_pipeline_panel(self, force: bool = False) -> None:
         """Update the pipeline visualization.
 
@@ -2469,10 +3138,9 @@ Sort (S):      {self.sort_by}
         """Scroll the pipeline to keep the selected step visible."""
         try:
             scroll = self.query_one("#pipeline-scroll", HorizontalScroll)
-            # Each step box is box_width(18) + 2 borders + arrow_gap(5) = 25 chars
-            step_width = 23
-            target_x = max(0, self.selected_step_index * step_width - 10)
-            scroll.scroll_to(x=target_x, animate=False)
+            target_x = max(0, self.selected_step_index * _PIPELINE_STEP_WIDTH - 10)
+            if scroll.scroll_x != target_x:
+                scroll.scroll_to(x=target_x, animate=False)
         except Exception:
             pass
 
@@ -2485,9 +3153,11 @@ Sort (S):      {self.sort_by}
         def get_status(step, idx):
             return get_step_status_from_chunks(step.name, idx, chunks, pipeline)
 
+        step_failures = self._count_all_step_failures([step.name for step in steps])
+
         def get_failures(step, idx):
             """Count failures for this step."""
-            return self._count_step_failures(step.name)
+            return step_failures[step.name]
 
         def get_batch_detail(step, idx):
             """Return (submitted, pending) chunk counts for this step, or None."""
@@ -2509,11 +3179,8 @@ Sort (S):      {self.sort_by}
         # Load step configs to check for loop_until
         step_configs = None
         try:
-            config_path = self.run_data.run_dir / "config" / "config.yaml"
-            if config_path.exists():
-                import yaml
-                with open(config_path) as f:
-                    config = yaml.safe_load(f)
+            config = self._load_run_config()
+            if config:
                 step_configs = config.get("pipeline", {}).get("steps", [])
         except Exception:
             pass  # Gracefully handle missing/invalid config
@@ -2525,9 +3192,10 @@ Sort (S):      {self.sort_by}
         # appears when resolved == input (all units accounted for).
         step_funnel = {}
         step_valid_counts = {}
-        total_units = sum(c.total for c in chunks) if chunks else 0
+        total_units = self._chunk_totals()[0]
+        all_valid = self._count_all_step_valid(list(pipeline))
         for i, step_name in enumerate(pipeline):
-            valid = self._count_step_valid(step_name)
+            valid = all_valid[step_name]
             perm_failed = self._count_step_permanently_failed(step_name)
             step_valid_counts[step_name] = valid
             if i == 0:
@@ -2552,18 +3220,29 @@ Sort (S):      {self.sort_by}
         if self._cached_max_retries is not None:
             return self._cached_max_retries
         try:
-            import yaml
-            config_path = self.run_data.run_dir / "config" / "config.yaml"
-            if config_path.exists():
-                with open(config_path) as f:
-                    config = yaml.safe_load(f)
-                self._cached_max_retries = config.get("max_retries", 5)
-            else:
-                self._cached_max_retries = 5
+            config = self._load_run_config()
+            self._cached_max_retries = config.get("max_retries", 5) if config else 5
         except Exception:
             self._cached_max_retries = 5
         return self._cached_max_retries
 
+    def _memo_if_terminal(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return compute(), memoized for as long as the run stays terminal.
+
+        Once MANIFEST.json says complete/failed/killed the chunk files stop
+        changing, so the per-step disk scans are done once and then served
+        from memory without even a stat. Any non-terminal status (e.g. a
+        retry flipping the run back to running) drops the memo.
+        """
+        if self._last_manifest_status not in _TERMINAL_RUN_STATUSES:
+            self._terminal_scan_cache.clear()
+            return compute()
+        try:
+            return self._terminal_scan_cache[key]
+        except KeyError:
+            result = self._terminal_scan_cache[key] = compute()
+            return result
+
     def _count_step_failures(self, step_name: str) -> dict:
         """Categorize failures for a specific step by scanning failure files.
 
@@ -2572,72 +3251,136 @@ Sort (S):      {self.sort_by}
              "retrying": count, "exhausted": count,
              "max_retry_attempt": int, "max_retries": int}
         """
-        validation_stages = {"schema_validation", "validation"}
-        run_dir = self.run_data.run_dir
-        chunks_dir = run_dir / "chunks"
+        return self._count_all_step_failures([step_name])[step_name]
+
+    def _count_all_step_failures(self, step_names: list[str]) -> dict[str, dict]:
+        """Categorize failures for several steps in one walk over the chunk dirs.
+
+        Counts are merged from per-file counters (see _failure_file_stats),
+        so an unchanged run only costs a stat per file. See
+        _count_step_failures for the shape of each value.
+        """
+        return self._memo_if_terminal(
+            ("failures", tuple(step_names)), lambda: self._scan_all_step_failures(step_names)
+        )
+
+    def _scan_all_step_failures(self, step_names: list[str]) -> dict[str, dict]:
+        """Disk scan behind _count_all_step_failures."""
+        chunks_dir = self.run_data.run_dir / "chunks"
         max_retries = self._get_max_retries()
-        is_running = getattr(self, '_last_manifest_status', None) == "running"
+        is_running = self._last_manifest_status == "running"
 
-        if not chunks_dir.exists():
-            return {"validation": 0, "hard": 0, "total": 0,
-                    "retrying": 0, "exhausted": 0,
-                    "max_retry_attempt": 0, "max_retries": max_retries}
-
-        validation = 0
-        hard = 0
-        retrying = 0
-        exhausted = 0
-        max_retry_attempt = 0
-        for chunk_dir in chunks_dir.iterdir():
-            if not chunk_dir.is_dir():
-                continue
-            failures_path = _find_jsonl_file(chunk_dir / f"{step_name}_failures.jsonl")
-            if failures_path:
+        results = {
+            name: {"validation": 0, "hard": 0, "total": 0, "retrying": 0, "exhausted": 0,
+                   "max_retry_attempt": 0, "max_retries": max_retries}
+            for name in step_names
+        }
+        for chunk_dir in self._list_chunk_dirs(chunks_dir):
+            for step_name, result in results.items():
+                failures_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_failures.jsonl")
+                if not failures_path:
+                    continue
                 try:
-                    with _open_jsonl(failures_path) as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            try:
-                                failure = json.loads(line)
-                                stage = failure.get("failure_stage", "validation")
-                                if stage in validation_stages:
-                                    validation += 1
-                                    retry_count = failure.get("retry_count", 0)
-                                    if is_running and retry_count < max_retries:
-                                        retrying += 1
-                                        max_retry_attempt = max(max_retry_attempt, retry_count)
-                                    else:
-                                        exhausted += 1
-                                else:
-                                    hard += 1
-                            except json.JSONDecodeError:
-                                hard += 1
+                    stats = self._failure_file_stats(failures_path)
                 except Exception:
-                    pass
-        return {"validation": validation, "hard": hard, "total": validation + hard,
-                "retrying": retrying, "exhausted": exhausted,
-                "max_retry_attempt": max_retry_attempt, "max_retries": max_retries}
+                    continue
+                result["hard"] += stats["hard"]
+                for retry_count, n in stats["retry_counts"].items():
+                    result["validation"] += n
+                    if is_running and retry_count < max_retries:
+                        result["retrying"] += n
+                        result["max_retry_attempt"] = max(result["max_retry_attempt"], retry_count)
+                    else:
+                        result["exhausted"] += n
+
+        for result in results.values():
+            result["total"] = result["validation"] + result["hard"]
+        return results
+
+    def _count_failure_rows(self, step_names: list[str]) -> int:
+        """Count failure records for several steps in one pass over the chunks.
+
+        Equivalent to summing _count_step_failures(step)["total"], which
+        counts every non-blank line (unparseable ones as hard failures), so
+        rows are counted without JSON-decoding them.
+        """
+        chunks_dir = self.run_data.run_dir / "chunks"
+        if not step_names or not chunks_dir.exists():
+            return 0
+        total = 0
+        for chunk_dir in self._list_chunk_dirs(chunks_dir):
+            for step_name in step_names:
+                failures_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_failures.jsonl")
+                if failures_path:
+                    try:
+                        total += self._count_jsonl_records(failures_path)
+                    except Exception:
+                        pass
+        return total
 
     def _count_step_valid(self, step_name: str) -> int:
         """Count valid units for a step by scanning validated files on disk."""
-        run_dir = self.run_data.run_dir
-        chunks_dir = run_dir / "chunks"
-        if not chunks_dir.exists():
-            return 0
-        count = 0
-        for chunk_dir in chunks_dir.iterdir():
-            if not chunk_dir.is_dir():
-                continue
-            validated_path = _find_jsonl_file(chunk_dir / f"{step_name}_validated.jsonl")
-            if validated_path:
-                try:
-                    with _open_jsonl(validated_path) as f:
-                        count += sum(1 for line in f if line.strip())
-                except Exception:
-                    pass
-        return count
+        return self._count_all_step_valid([step_name])[step_name]
+
+    def _count_all_step_valid(self, step_names: list[str]) -> dict[str, int]:
+        """Count valid units for several steps in one walk over the chunk dirs."""
+        return self._memo_if_terminal(
+            ("valid", tuple(step_names)), lambda: self._scan_all_step_valid(step_names)
+        )
+
+    def _scan_all_step_valid(self, step_names: list[str]) -> dict[str, int]:
+        """Disk scan behind _count_all_step_valid."""
+        counts = dict.fromkeys(step_names, 0)
+        chunks_dir = self.run_data.run_dir / "chunks"
+        for chunk_dir in self._list_chunk_dirs(chunks_dir):
+            for step_name in counts:
+                validated_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_validated.jsonl")
+                if validated_path:
+                    try:
+                        counts[step_name] += self._count_jsonl_records(validated_path)
+                    except Exception:
+                        pass
+        return counts
+
+    def _count_jsonl_records(self, path: Path) -> int:
+        """Count non-blank lines in a JSONL file, re-reading only appended bytes.
+
+        An unchanged (mtime_ns, size) costs a stat, a grown file whose
+        bytes before the last offset still match is counted from that
+        offset, and anything else (rewrite, truncation, .gz) is a full count.
+        """
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._record_count_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[4]
+
+        if path.suffix == ".gz":
+            with _jsonl_lines(path) as lines:
+                count = sum(1 for _ in lines)
+            self._record_count_cache[path] = (signature, 0, b"", count, count)
+            return count
+
+        with open(path, "rb") as f:
+            offset, complete = 0, 0
+            if cached is not None and stat.st_size > cached[1]:
+                _, cached_offset, check, cached_complete, _ = cached
+                f.seek(cached_offset - len(check))
+                if f.read(len(check)) == check:
+                    offset, complete = cached_offset, cached_complete
+            f.seek(offset)
+            data = f.read()
+            # Only whole lines advance the offset; a trailing partial line
+            # is counted now and re-read once it is finished.
+            whole_end = data.rfind(b"\n") + 1
+            partial = data[whole_end:]
+            complete += _count_nonblank_lines(data, whole_end)
+            offset += whole_end
+            f.seek(max(0, offset - 64))
+            check = f.read(offset - f.tell())
+        total = complete + (1 if partial.strip() else 0)
+        self._record_count_cache[path] = (signature, offset, check, complete, total)
+        return total
 
     def _count_step_permanently_failed(self, step_name: str) -> int:
         """Count unique units that permanently failed at a step.
@@ -2646,6 +3389,12 @@ Sort (S):      {self.sort_by}
         failed if it appears in a failures file but NOT in any validated
         file for the same step.
         """
+        return self._memo_if_terminal(
+            ("perm_failed", step_name), lambda: self._scan_step_permanently_failed(step_name)
+        )
+
+    def _scan_step_permanently_failed(self, step_name: str) -> int:
+        """Disk scan behind _count_step_permanently_failed."""
         run_dir = self.run_data.run_dir
         chunks_dir = run_dir / "chunks"
         if not chunks_dir.exists():
@@ -2653,130 +3402,128 @@ Sort (S):      {self.sort_by}
 
         # Collect all validated unit_ids for this step across ALL chunk dirs
         validated_ids: set[str] = set()
-        for chunk_dir in chunks_dir.iterdir():
-            if not chunk_dir.is_dir():
-                continue
-            validated_path = _find_jsonl_file(chunk_dir / f"{step_name}_validated.jsonl")
+        for chunk_dir in self._list_chunk_dirs(chunks_dir):
+            validated_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_validated.jsonl")
             if validated_path:
                 try:
-                    with _open_jsonl(validated_path) as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            try:
-                                unit = json.loads(line)
-                                uid = unit.get("unit_id")
-                                if uid:
-                                    validated_ids.add(uid)
-                            except json.JSONDecodeError:
-                                continue
+                    validated_ids |= self._validated_file_stats(validated_path)["ids"]
                 except Exception:
                     pass
 
-        # Collect unique failed unit_ids NOT in validated set
+        # Collect unique failed unit_ids; those validated elsewhere are dropped below
         failed_ids: set[str] = set()
-        for chunk_dir in chunks_dir.iterdir():
-            if not chunk_dir.is_dir():
-                continue
-            failures_path = _find_jsonl_file(chunk_dir / f"{step_name}_failures.jsonl")
+        for chunk_dir in self._list_chunk_dirs(chunks_dir):
+            failures_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_failures.jsonl")
             if failures_path:
                 try:
-                    with _open_jsonl(failures_path) as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            try:
-                                failure = json.loads(line)
-                                uid = failure.get("unit_id")
-                                if uid and uid not in validated_ids:
-                                    failed_ids.add(uid)
-                            except json.JSONDecodeError:
-                                continue
+                    failed_ids |= self._failure_file_stats(failures_path)["ids"]
                 except Exception:
                     pass
 
-        return len(failed_ids)
+        return len(failed_ids - validated_ids)
+
+    def _validated_file_stats(self, path: Path) -> dict:
+        """Unit ids and loop-iteration totals for one *_validated.jsonl file."""
+        return self._fold_jsonl(path, self._validated_stats_cache, _new_validated_stats, _add_validated_row)
+
+    def _failure_file_stats(self, path: Path) -> dict:
+        """Unit ids, failure counters and error-pattern counts for one *_failures.jsonl file."""
+        return self._fold_jsonl(path, self._failure_stats_cache, _new_failure_stats, _add_failure_row)
+
+    def _fold_jsonl(
+        self,
+        path: Path,
+        cache: dict,
+        new: Callable[[dict | None], dict],
+        add: Callable[[dict, Any], None],
+    ) -> dict:
+        """Fold a JSONL file into a small per-file summary, reading only appended bytes.
+
+        Same growth check as _count_jsonl_records: an unchanged
+        (mtime_ns, size) costs a stat, a grown file whose bytes before the
+        last offset still match is folded from that offset, and anything
+        else (rewrite, truncation, .gz) is a full read. Rows are dropped
+        once folded, so the cache holds only the summaries.
+
+        Returns:
+            The file's accumulator; shared with the cache, treat as read-only.
+        """
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[3]
+
+        if path.suffix == ".gz":
+            acc = new(None)
+            with _jsonl_lines(path) as lines:
+                for line in lines:
+                    try:
+                        row = json_io.loads(line)
+                    except json.JSONDecodeError:
+                        row = None
+                    add(acc, row)
+            cache[path] = (signature, 0, b"", acc)
+            return acc
+
+        with open(path, "rb") as f:
+            offset, prev = 0, None
+            if cached is not None and stat.st_size > cached[1]:
+                _, cached_offset, check, cached_acc = cached
+                f.seek(cached_offset - len(check))
+                if f.read(len(check)) == check:
+                    offset, prev = cached_offset, cached_acc
+            f.seek(offset)
+            acc = new(prev)
+            for offset, row in _iter_jsonl_from(f):
+                add(acc, row)
+            f.seek(max(0, offset - 64))
+            check = f.read(offset - f.tell())
+        cache[path] = (signature, offset, check, acc)
+        return acc
 
     def _get_failure_summary(self, step_name: str) -> list[tuple[str, str, int]]:
-        """Get grouped failure summary for a step. Cached; invalidated on file mtime change.
+        """Get grouped failure summary for a step, merged from per-file pattern counts.
 
         Returns list of (stage, error_pattern, count) sorted by count descending.
         stage is 'validation' or 'hard'.
         """
-        validation_stages = {"schema_validation", "validation"}
+        return self._memo_if_terminal(
+            ("summary", step_name), lambda: self._scan_failure_summary(step_name)
+        )
+
+    def _scan_failure_summary(self, step_name: str) -> list[tuple[str, str, int]]:
+        """Disk scan behind _get_failure_summary."""
         run_dir = self.run_data.run_dir
         chunks_dir = run_dir / "chunks"
         if not chunks_dir.exists():
             return []
 
-        # Check mtimes to see if cache is still valid
-        max_mtime = 0.0
-        for chunk_dir in chunks_dir.glob("chunk_*"):
-            if not chunk_dir.is_dir():
-                continue
-            failures_path = _find_jsonl_file(chunk_dir / f"{step_name}_failures.jsonl")
-            if failures_path:
-                try:
-                    max_mtime = max(max_mtime, failures_path.stat().st_mtime)
-                except OSError:
-                    pass
-
-        cached_mtime = self._failure_summary_mtimes.get(step_name, 0.0)
-        if step_name in self._failure_summary_cache and max_mtime == cached_mtime:
-            return self._failure_summary_cache[step_name]
-
-        # Scan and group failures
-        from collections import Counter
         groups: Counter = Counter()  # (stage, pattern) -> count
-
-        for chunk_dir in chunks_dir.glob("chunk_*"):
-            if not chunk_dir.is_dir():
-                continue
-            failures_path = _find_jsonl_file(chunk_dir / f"{step_name}_failures.jsonl")
+        for chunk_dir in self._list_chunk_dirs(chunks_dir, "chunk_"):
+            failures_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_failures.jsonl")
             if not failures_path:
                 continue
             try:
-                with _open_jsonl(failures_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            failure = json.loads(line)
-                            stage_raw = failure.get("failure_stage", "validation")
-                            stage = "validation" if stage_raw in validation_stages else "hard"
-                            # Extract a short error pattern
-                            error_msg = failure.get("error_message", "") or failure.get("error", "") or ""
-                            if not error_msg:
-                                # Try to get from nested validation_errors
-                                val_errors = failure.get("validation_errors", [])
-                                if val_errors and isinstance(val_errors, list):
-                                    error_msg = str(val_errors[0])[:80]
-                            # Truncate and normalize for grouping
-                            pattern = error_msg[:80].strip() if error_msg else "unknown"
-                            groups[(stage, pattern)] += 1
-                        except json.JSONDecodeError:
-                            groups[("hard", "parse error")] += 1
+                groups.update(self._failure_file_stats(failures_path)["groups"])
             except Exception:
-                pass
+                continue
 
         # Sort by count descending, take top 5
-        result = [(stage, pattern, count) for (stage, pattern), count in groups.most_common(5)]
-        self._failure_summary_cache[step_name] = result
-        self._failure_summary_mtimes[step_name] = max_mtime
-        return result
+        return [(stage, pattern, count) for (stage, pattern), count in groups.most_common(5)]
 
     def _update_detail_panel(self) -> None:
-        """Update the detail panel based on current view."""
+        """Update the detail panel based on current view.
+
+        If the current view's table is already mounted, its header and rows
+        are refreshed in place; the panel is only rebuilt when the view
+        switches or the table gives way to a loading/empty message.
+        """
         try:
             container = self.query_one("#detail-panel", VerticalScroll)
         except NoMatches:
             return
 
-        container.remove_children()
-
         if self.current_view == "chunk":
             self._render_chunk_view(container)
         else:
@@ -2813,14 +3560,7 @@ Sort (S):      {self.sort_by}
         else:
             header = f"[bold]{step_name.upper()}[/]"
 
-        container.mount(Static(header, classes="detail-header"))
-
-        # Create DataTable for chunks
-        table = DataTable()
-        table.cursor_type = "row"
-        table.zebra_stripes = True
-        table.add_columns("", "Chunk", "Progress", "Count", "Errors", "Status")
-
+        rows = []
         for chunk in chunks_at_step:
             progress_bar = make_progress_bar(chunk.valid, chunk.total, 20)
             count = f"{chunk.valid}/{chunk.total}"
@@ -2834,22 +3574,51 @@ Sort (S):      {self.sort_by}
             else:
                 errors_display = "[dim]0[/]"
 
-            table.add_row(symbol, chunk.name, progress_bar, count, errors_display, step_display)
-
-        container.mount(table)
-        self._chunk_table = table
+            rows.append((symbol, chunk.name, progress_bar, count, errors_display, step_display))
+
+        table = self._chunk_table
+        if not self._refresh_table_in_place(table, header, rows):
+            container.remove_children()
+            self._detail_header = Static(header, classes="detail-header")
+            container.mount(self._detail_header)
+
+            # Create DataTable for chunks
+            table = DataTable()
+            table.cursor_type = "row"
+            table.zebra_stripes = True
+            table.add_columns("", "Chunk", "Progress", "Count", "Errors", "Status")
+            table.add_rows(rows)
+            container.mount(table)
+            self._chunk_table = table
+            self._unit_table = None
 
         if self.selected_chunk_index < len(chunks_at_step):
             table.move_cursor(row=self.selected_chunk_index)
 
+    def _refresh_table_in_place(self, table: DataTable | None, header: str, rows: list[tuple]) -> bool:
+        """Swap new header text and rows into a mounted detail table.
+
+        Returns False when there is no live table/header to reuse, in which
+        case the caller rebuilds the panel.
+        """
+        header_widget = self._detail_header
+        if table is None or header_widget is None or not (table.is_attached and header_widget.is_attached):
+            return False
+        header_widget.update(header)
+        table.clear()
+        table.add_rows(rows)
+        return True
+
     def _render_unit_view(self, container: VerticalScroll) -> None:
         """Render the unit view with all units."""
         # If units haven't been loaded yet, start async load and show indicator
         if not self._units_loaded:
             if not self._units_loading:
                 self._start_unit_load()
+            container.remove_children()
             container.mount(Static("[dim]Loading units...[/]", classes="empty-state"))
             self._unit_table = None
+            self._chunk_table = None
             return
 
         self._filtered_units = self._get_filtered_units()
@@ -2859,7 +3628,6 @@ Sort (S):      {self.sort_by}
         manifest_total = self._get_manifest_total_items()
         showing = len(self._filtered_units)
         header = f"[bold]All Units[/]  ({showing} cached rows, {manifest_total} total units)"
-        container.mount(Static(header, classes="detail-header"))
 
         if not self._filtered_units:
             # Determine appropriate empty message
@@ -2875,16 +3643,16 @@ Sort (S):      {self.sort_by}
                 if self.status_filter != "all" or self.step_filter != "all":
                     empty_msg += " - try changing filters"
                 empty_msg += "[/]"
+            container.remove_children()
+            container.mount(Static(header, classes="detail-header"))
             container.mount(Static(empty_msg, classes="empty-state"))
             self._unit_table = None
+            self._chunk_table = None
             return
 
-        # Create DataTable for units
-        table = DataTable()
-        table.cursor_type = "row"
-        table.zebra_stripes = True
-        table.add_columns("", "Unit ID", "Chunk", "Step", "Attempts", "Status")
-
+        max_retries = self._get_max_retries()
+        is_running = self._last_manifest_status == "running"
+        rows = []
         for unit in self._filtered_units:
             unit_id = unit["unit_id"]
             if len(unit_id) > 35:
@@ -2900,8 +3668,6 @@ Sort (S):      {self.sort_by}
                 status_text = "valid"
             elif status == "failed":
                 retry_count = unit.get("attempts", 1) - 1  # attempts = retry_count + 1
-                max_retries = self._get_max_retries()
-                is_running = getattr(self, '_last_manifest_status', None) == "running"
                 failure_stage = unit.get("failure_stage", "unknown")
                 is_validation = failure_stage in ("schema_validation", "validation")
 
@@ -2921,10 +3687,23 @@ Sort (S):      {self.sort_by}
                 symbol = "[dim]○[/]"
                 status_text = "pending"
 
-            table.add_row(symbol, unit_id, chunk_name, unit["step"], attempts_display, status_text)
+            rows.append((symbol, unit_id, chunk_name, unit["step"], attempts_display, status_text))
+
+        table = self._unit_table
+        if not self._refresh_table_in_place(table, header, rows):
+            container.remove_children()
+            self._detail_header = Static(header, classes="detail-header")
+            container.mount(self._detail_header)
 
-        container.mount(table)
-        self._unit_table = table
+            # Create DataTable for units
+            table = DataTable()
+            table.cursor_type = "row"
+            table.zebra_stripes = True
+            table.add_columns("", "Unit ID", "Chunk", "Step", "Attempts", "Status")
+            table.add_rows(rows)
+            container.mount(table)
+            self._unit_table = table
+            self._chunk_table = None
 
         # Ensure selection is within bounds
         if self.selected_unit_index >= len(self._filtered_units):
@@ -2981,8 +3760,7 @@ Sort (S):      {self.sort_by}
         if not status:
             self.notify("Cannot archive: manifest missing or unreadable", severity="warning")
             return
-        terminal_statuses = {"complete", "failed", "killed"}
-        if status not in terminal_statuses:
+        if status not in _TERMINAL_RUN_STATUSES:
             self.notify("Can only archive completed, failed, or killed runs", severity="warning")
             return
 
@@ -3127,7 +3905,7 @@ Sort (S):      {self.sort_by}
 
         unit = self._filtered_units[self.selected_unit_index]
         _log.debug(f"Showing unit detail for: {unit.get('unit_id')}")
-        self.app.push_screen(UnitDetailModal(unit))
+        self.app.push_screen(UnitDetailModal(unit, tree_spec_cache=self._unit_tree_spec_cache))
 
     # --- Filter/Sort Actions (Unit View Only) ---
 
@@ -3153,18 +3931,17 @@ Sort (S):      {self.sort_by}
             self.notify("Switch to unit view (V) to retry failures", severity="warning")
             return
 
-        # Count failed units in current filter
-        validation_stages = {"schema_validation", "validation"}
-        failed_units = [u for u in self._filtered_units if u["status"] == "failed"]
-        if not failed_units:
-            self.notify("No failed units to retry", severity="information")
-            return
-
-        # Split into retryable (validation) vs non-retryable (hard)
-        retryable = [u for u in failed_units
-                     if u.get("failure_stage", "validation") in validation_stages]
-        hard = [u for u in failed_units
-                if u.get("failure_stage", "validation") not in validation_stages]
+        # Split failed units in current filter into retryable (validation)
+        # vs non-retryable (hard) in one pass
+        retryable: list[dict] = []
+        hard: list[dict] = []
+        for u in self._filtered_units:
+            if u["status"] != "failed":
+                continue
+            if u.get("failure_stage", "validation") in _VALIDATION_STAGES:
+                retryable.append(u)
+            else:
+                hard.append(u)
 
         if not retryable:
             if hard:
@@ -3211,15 +3988,20 @@ Sort (S):      {self.sort_by}
 
             # 2. Update manifest status to allow reprocessing
             manifest_path = run_dir / "MANIFEST.json"
-            manifest = json.loads(manifest_path.read_text())
+            manifest = json_io.loads(manifest_path.read_bytes())
             manifest["status"] = "running"  # Change from "complete" or "failed"
             manifest["retry_requested_at"] = datetime.now().isoformat()
             manifest.pop("error_message", None)  # Clear any error message
 
-            # Atomic write
-            tmp_path = manifest_path.with_suffix(".tmp")
-            tmp_path.write_text(json.dumps(manifest, indent=2))
-            tmp_path.rename(manifest_path)
+            # Atomic write. The orchestrator is spawned right after and reads
+            # this file, so flush it to disk before swapping it in; os.replace
+            # also overwrites on Windows, where Path.rename raises.
+            tmp_path = run_dir / "MANIFEST.json.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(json_io.dumps_pretty(manifest))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, manifest_path)
 
             # 3. Spawn orchestrator to process retries
             mode = getattr(self.run_data, 'mode', 'batch') or 'batch'
@@ -3243,8 +4025,8 @@ Sort (S):      {self.sort_by}
             # Restart the auto-refresh loop (it stops when a run becomes terminal)
             if not self._refresh_active:
                 self._refresh_active = True
-                self.set_timer(2.0, self._do_refresh)
-                self.set_timer(5.0, self._do_unit_refresh)
+                self._arm_refresh()
+                self._arm_unit_refresh()
 
         except Exception as e:
             self.notify(f"Retry failed: {e}", severity="error")
@@ -3503,7 +4285,7 @@ Sort (S):      {self.sort_by}
             error_counters[step_name] = Counter()
             for chunk_name in sorted(manifest.get("chunks", {}).keys()):
                 chunk_dir = run_dir / "chunks" / chunk_name
-                failures_path = _find_jsonl_file(chunk_dir / f"{step_name}_failures.jsonl")
+                failures_path = self._find_chunk_jsonl(chunk_dir, f"{step_name}_failures.jsonl")
                 if not failures_path:
                     continue
                 try:
@@ -3513,7 +4295,7 @@ Sort (S):      {self.sort_by}
                             if not line:
                                 continue
                             try:
-                                rec = json.loads(line)
+                                rec = json_io.loads(line)
                             except json.JSONDecodeError:
                                 continue
                             failure_summary[step_name] = failure_summary.get(step_name, 0) + 1
@@ -15,6 +15,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Static, Button, Input, Select, RadioButton, RadioSet
 from textual.binding import Binding
 from textual.css.query import NoMatches
+from textual import work
 
 from .common import _log
 from .run_launcher import start_realtime_run, start_batch_run
@@ -136,11 +137,12 @@ class NewRunModal(ModalScreen):
 
         Args:
             pipelines: Optional list of pipeline dicts. If not provided,
-                      will be loaded via scan_pipelines().
+                      will be loaded via scan_pipelines() in a worker
+                      after the modal mounts.
         """
         super().__init__(**kwargs)
-        # Load pipelines if not provided
-        self._pipelines = pipelines if pipelines is not None else scan_pipelines()
+        # None until loaded - see _load_options_worker()
+        self._pipelines: Optional[List[Dict[str, Any]]] = pipelines
         self._selected_pipeline: Optional[Dict[str, Any]] = None
         self._runs_dir = get_runs_dir()
         self._scripts_dir = Path(__file__).parent.parent.parent
@@ -155,11 +157,16 @@ class NewRunModal(ModalScreen):
                 # Pipeline selector
                 with Horizontal(classes="form-row"):
                     yield Static("Pipeline:", classes="form-label")
-                    pipeline_options = [
-                        (f"{p['name']} ({p['step_count']} steps)", p['name'])
-                        for p in self._pipelines
-                    ]
-                    if pipeline_options:
+                    if self._pipelines is None:
+                        yield Select(
+                            [],
+                            id="pipeline-select",
+                            prompt="Loading pipelines...",
+                            classes="form-input",
+                            disabled=True,
+                        )
+                    elif self._pipelines:
+                        pipeline_options = self._pipeline_options(self._pipelines)
                         yield Select(
                             pipeline_options,
                             id="pipeline-select",
@@ -178,17 +185,11 @@ class NewRunModal(ModalScreen):
                         classes="form-input"
                     )
 
-                # Provider selector
+                # Provider selector (providers are filled in by _load_options_worker)
                 with Horizontal(classes="form-row"):
                     yield Static("Provider:", classes="form-label")
-                    provider_options = [
-                        ("Use Pipeline Config", "pipeline_default"),
-                    ] + [
-                        (f"{name.capitalize()} ({info.get('default_model', 'N/A')})", name)
-                        for name, info in LLMProvider.get_all_providers().items()
-                    ]
                     yield Select(
-                        provider_options,
+                        [("Use Pipeline Config", "pipeline_default")],
                         id="provider-select",
                         value="pipeline_default",
                         classes="form-input",
@@ -249,6 +250,60 @@ class NewRunModal(ModalScreen):
         """Set up initial state."""
         # Don't auto-select or auto-generate name - wait for user to select a pipeline
         self._update_start_button()
+        # Pipeline scan and model registry read hit the disk - keep them off the UI thread
+        self._load_options_worker()
+
+    @staticmethod
+    def _pipeline_options(pipelines: List[Dict[str, Any]]) -> list:
+        """Build pipeline Select options from scan_pipelines() dicts."""
+        return [
+            (f"{p['name']} ({p['step_count']} steps)", p['name'])
+            for p in pipelines
+        ]
+
+    @work(thread=True, exclusive=True, group="new-run-options")
+    def _load_options_worker(self) -> None:
+        """Load pipelines (if not passed in) and providers in a worker thread."""
+        pipelines = self._pipelines
+        try:
+            if pipelines is None:
+                pipelines = scan_pipelines()
+        except Exception as e:
+            _log.debug(f"Pipeline scan error: {e}")
+            pipelines = []
+        try:
+            providers = LLMProvider.get_all_providers()
+        except Exception as e:
+            _log.debug(f"Model registry load error: {e}")
+            providers = {}
+        self.app.call_from_thread(self._on_options_loaded, pipelines, providers)
+
+    def _on_options_loaded(self, pipelines: List[Dict[str, Any]], providers: dict) -> None:
+        """Populate the pipeline and provider dropdowns on the main thread."""
+        if self._pipelines is None:
+            self._pipelines = pipelines
+            try:
+                pipeline_select = self.query_one("#pipeline-select", Select)
+                if pipelines:
+                    pipeline_select.prompt = "Select a pipeline..."
+                    pipeline_select.set_options(self._pipeline_options(pipelines))
+                    pipeline_select.disabled = False
+                else:
+                    pipeline_select.prompt = "No pipelines found"
+            except NoMatches:
+                pass
+
+        try:
+            provider_select = self.query_one("#provider-select", Select)
+            provider_select.set_options([
+                ("Use Pipeline Config", "pipeline_default"),
+            ] + [
+                (f"{name.capitalize()} ({info.get('default_model', 'N/A')})", name)
+                for name, info in providers.items()
+            ])
+            provider_select.value = "pipeline_default"
+        except NoMatches:
+            pass
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle pipeline or provider selection change."""
@@ -256,7 +311,7 @@ class NewRunModal(ModalScreen):
             selected_name = event.value
             if selected_name != Select.BLANK:
                 # Find the selected pipeline
-                for p in self._pipelines:
+                for p in self._pipelines or ():
                     if p["name"] == selected_name:
                         self._selected_pipeline = p
                         break
@@ -16,6 +16,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import json_io
+
 
 def _open_jsonl_for_read(path: Path):
     """Open a JSONL file for reading, handling both plain and gzipped formats."""
@@ -108,7 +110,7 @@ class DiagnosticExporter:
                             line = line.strip()
                             if line:
                                 try:
-                                    failure = json.loads(line)
+                                    failure = json_io.loads(line)
                                     # Track which chunk/file it came from
                                     failure["_source_chunk"] = chunk_dir.name
                                     failure["_source_file"] = failure_file.name
@@ -136,7 +138,7 @@ class DiagnosticExporter:
                             line = line.strip()
                             if line:
                                 try:
-                                    prompt_data = json.loads(line)
+                                    prompt_data = json_io.loads(line)
                                     unit_id = prompt_data.get("unit_id")
                                     if unit_id:
                                         index[unit_id] = prompt_data
@@ -443,7 +445,7 @@ def scan_step_health(run_dir: Path, pipeline: list[str]) -> list[dict]:
                             if not line:
                                 continue
                             try:
-                                failure = json.loads(line)
+                                failure = json_io.loads(line)
                                 stage = failure.get("failure_stage", "validation")
                                 if stage in validation_stages:
                                     validation_fail_count += 1
@@ -590,7 +592,7 @@ def get_step_failure_analysis(run_dir: Path, step_name: str) -> dict:
                     line = line.strip()
                     if line:
                         try:
-                            all_failures.append(json.loads(line))
+                            all_failures.append(json_io.loads(line))
                         except json.JSONDecodeError:
                             pass
         except Exception:
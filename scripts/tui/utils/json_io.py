@@ -0,0 +1,56 @@
+"""
+JSON encode/decode helpers for Octobatch TUI.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+Manifests and JSONL files are parsed on every refresh tick, so the faster
+decoder matters on large runs. orjson is optional, like psutil.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception whichever backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as bytes or str (bytes skips a UTF-8 decode with orjson)
+
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Serialize an object as 2-space indented UTF-8 JSON.
+
+    Indentation matches json.dumps(obj, indent=2). Both backends write
+    non-ASCII text as raw UTF-8 rather than \\uXXXX escapes, and coerce
+    non-str dict keys to strings, so neither depends on which backend is
+    installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
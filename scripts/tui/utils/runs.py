@@ -1530,6 +1530,47 @@ def resume_orchestrator(run_dir: Path, mode: str = "watch") -> bool:
         return False
 
 
+def wait_for_orchestrator_ready(
+    run_dir: Path,
+    timeout: float = 5.0,
+    interval: float = 0.05,
+) -> bool:
+    """
+    Block until the run's orchestrator has written a PID file for a live process.
+
+    PID files persist after the orchestrator exits, so the PID is verified
+    against the running process rather than trusting the file's existence.
+    Intended to be called from a worker thread, never the UI thread.
+
+    Args:
+        run_dir: Path to the run directory
+        timeout: Maximum seconds to wait
+        interval: Seconds between PID file checks
+
+    Returns:
+        True if a live orchestrator was seen before the timeout
+    """
+    run_dir = Path(run_dir).resolve()
+    pid_file = run_dir / "orchestrator.pid"
+
+    if not PSUTIL_AVAILABLE:
+        # Can't verify the PID - the file existing is the best signal we have
+        return pid_file.exists()
+
+    run_dir_str = str(run_dir)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            pid = int(pid_file.read_text().strip())
+            if _verify_orchestrator_process(pid, run_dir_str):
+                return True
+        except (ValueError, OSError):
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
 def _revert_manifest_status(manifest_path: Path, previous_status: str | None) -> None:
     """Revert manifest status after a failed orchestrator spawn."""
     if previous_status is None or not manifest_path.exists():
@@ -136,3 +136,456 @@ def test_text_input_modal_bindings():
     from tui.screens.modals import TextInputModal
     binding_keys = [b.key for b in TextInputModal.BINDINGS]
     assert "escape" in binding_keys
+
+
+# --- Orchestrator readiness tests ---
+
+
+def test_wait_for_orchestrator_ready_live_pid(tmp_path, monkeypatch):
+    import tui.utils.runs as runs_mod
+    (tmp_path / "orchestrator.pid").write_text("4242")
+    monkeypatch.setattr(runs_mod, "PSUTIL_AVAILABLE", True)
+    monkeypatch.setattr(runs_mod, "_verify_orchestrator_process", lambda pid, _d: pid == 4242)
+    assert runs_mod.wait_for_orchestrator_ready(tmp_path, timeout=1.0)
+
+
+def test_wait_for_orchestrator_ready_stale_pid_times_out(tmp_path, monkeypatch):
+    import tui.utils.runs as runs_mod
+    (tmp_path / "orchestrator.pid").write_text("4242")
+    monkeypatch.setattr(runs_mod, "PSUTIL_AVAILABLE", True)
+    monkeypatch.setattr(runs_mod, "_verify_orchestrator_process", lambda _pid, _d: False)
+    assert not runs_mod.wait_for_orchestrator_ready(tmp_path, timeout=0.1, interval=0.02)
+
+
+# --- JSON backend tests ---
+
+
+def test_json_io_round_trip_matches_stdlib_layout(monkeypatch):
+    import tui.utils.json_io as json_io
+    data = {"status": "running", "chunks": {"chunk_000": {"valid": 3}}, "pipeline": []}
+    encoded = json_io.dumps_pretty(data)
+    assert encoded.decode("utf-8") == json.dumps(data, indent=2)
+    assert json_io.loads(encoded) == data
+    # Stdlib fallback behaves the same
+    monkeypatch.setattr(json_io, "ORJSON_AVAILABLE", False)
+    assert json_io.dumps_pretty(data) == encoded
+    assert json_io.loads(encoded) == data
+
+
+def test_json_io_non_ascii_and_int_keys_same_on_both_backends(monkeypatch):
+    import tui.utils.json_io as json_io
+    data = {"pipeline": ["r\u00e9sum\u00e9"], "note": "\u6587\u5b57 \u2713", 3: "int key"}
+    expected = {"pipeline": ["r\u00e9sum\u00e9"], "note": "\u6587\u5b57 \u2713", "3": "int key"}
+    backends = [True, False] if json_io.ORJSON_AVAILABLE else [False]
+    outputs = []
+    for available in backends:
+        monkeypatch.setattr(json_io, "ORJSON_AVAILABLE", available)
+        encoded = json_io.dumps_pretty(data)
+        assert "r\u00e9sum\u00e9".encode("utf-8") in encoded  # raw UTF-8, not \\u escapes
+        assert json_io.loads(encoded) == expected
+        assert json.loads(encoded) == expected
+        outputs.append(encoded)
+    assert len(set(outputs)) == 1
+
+
+# --- Log ticker tail tests ---
+
+
+def test_tail_lines_reads_last_lines_across_blocks(tmp_path):
+    from tui.screens.main_screen import _tail_lines
+    log = tmp_path / "RUN_LOG.txt"
+    log.write_text("".join(f"[2026-01-28T19:11:{i % 60:02d}Z] [POLL] line {i}\n" for i in range(500)))
+    assert _tail_lines(log, 4, block_size=64) == [
+        f"[2026-01-28T19:11:{i % 60:02d}Z] [POLL] line {i}" for i in range(496, 500)
+    ]
+    log.write_text("only\n")
+    assert _tail_lines(log, 4) == ["only"]
+    log.write_text("")
+    assert _tail_lines(log, 4) == []
+
+
+def test_split_log_timestamp_matches_regex():
+    from tui.screens.main_screen import _split_log_timestamp, _LOG_TS_RE
+    cases = [
+        "[2026-01-28T19:11:03Z] [POLL] msg",
+        "[2026-01-28T19:11:03] no zulu",
+        "[2026-01-28T19:11:03Z]tight",
+        "[26-1-2T10:00Z] short date",
+        "[2026-01-28T19:11:03.123Z] fractional",
+        "[2026-01-28T19:11:03Z] [A] b ] c",
+        "plain line",
+        "",
+    ]
+    for line in cases:
+        match = _LOG_TS_RE.match(line)
+        assert _split_log_timestamp(line) == (match.groups() if match else None), line
+
+
+def test_refresh_watch_filter_matches_run_outputs():
+    from tui.screens.main_screen import _is_refresh_trigger
+    assert _is_refresh_trigger(None, "/runs/r1/MANIFEST.json")
+    assert _is_refresh_trigger(None, "/runs/r1/chunks/chunk_000/gen_validated.jsonl")
+    assert _is_refresh_trigger(None, "/runs/r1/chunks/chunk_000/gen_failures.jsonl.gz")
+    assert not _is_refresh_trigger(None, "/runs/r1/RUN_LOG.txt")
+    assert not _is_refresh_trigger(None, "/runs/r1/MANIFEST.json.tmp")
+
+
+def test_jsonl_lines_plain_gzip_and_empty(tmp_path):
+    import gzip
+    from tui.data import _jsonl_lines
+    body = '{"unit_id": "a"}\n\n  \n{"unit_id": "b"}'
+    plain = tmp_path / "x_validated.jsonl"
+    plain.write_text(body)
+    gz = tmp_path / "x_failures.jsonl.gz"
+    with gzip.open(gz, "wt") as f:
+        f.write(body + "\n")
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+
+    with _jsonl_lines(plain) as lines:
+        assert [json.loads(line)["unit_id"] for line in lines] == ["a", "b"]
+    with _jsonl_lines(gz) as lines:
+        assert [json.loads(line)["unit_id"] for line in lines] == ["a", "b"]
+    with _jsonl_lines(empty) as lines:
+        assert list(lines) == []
+
+
+def test_jsonl_rows_cache_reads_appended_rows_only(tmp_path):
+    import os
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._jsonl_rows_cache = {}
+    path = tmp_path / "gen_validated.jsonl"
+    path.write_text('{"unit_id": "a"}\n{"unit_id": "b"')  # second row mid-write
+
+    assert [r["unit_id"] for r in screen._read_jsonl_rows_cached(path, 10)] == ["a"]
+
+    with open(path, "a") as f:
+        f.write('}\nnot json\n{"unit_id": "c"}\n{"unit_id": "d"}\n')
+    assert [r["unit_id"] for r in screen._read_jsonl_rows_cached(path, 10)] == ["a", "b", "c", "d"]
+
+    # A rewrite that grows the file is detected and fully re-parsed
+    path.write_text('{"unit_id": "x"}\n{"unit_id": "y"}\n{"unit_id": "z"}\n{"unit_id": "w"}\n{"unit_id": "v"}\n')
+    os.utime(path, ns=(1, 1))
+    assert [r["unit_id"] for r in screen._read_jsonl_rows_cached(path, 10)] == ["x", "y", "z", "w", "v"]
+
+
+def test_jsonl_rows_cache_stops_at_limit_and_resumes(tmp_path):
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._jsonl_rows_cache = {}
+    path = tmp_path / "gen_validated.jsonl"
+    path.write_text("".join(f'{{"unit_id": "u{i}"}}\n' for i in range(100)))
+
+    assert len(screen._read_jsonl_rows_cached(path, 5)) == 5
+    assert len(screen._jsonl_rows_cache[path][3]) == 5  # nothing parsed past the limit
+    assert [r["unit_id"] for r in screen._read_jsonl_rows_cached(path, 7)][5:] == ["u5", "u6"]
+    assert len(screen._read_jsonl_rows_cached(path, 500)) == 100
+
+
+def test_validated_file_stats_fold_appended_rows(tmp_path):
+    import os
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._validated_stats_cache = {}
+    path = tmp_path / "gen_validated.jsonl"
+    path.write_text('{"unit_id": "a", "_metadata": {"iterations": 2}}\n{"unit_id": "b"')  # mid-write
+
+    stats = screen._validated_file_stats(path)
+    assert stats == {"ids": {"a"}, "iters_total": 2, "iters_count": 1}
+    assert screen._validated_file_stats(path) is stats
+
+    with open(path, "a") as f:
+        f.write(', "_metadata": {"iterations": 4}}\nnot json\n{"unit_id": "c"}\n')
+    assert screen._validated_file_stats(path) == {"ids": {"a", "b", "c"}, "iters_total": 6, "iters_count": 2}
+    assert stats["ids"] == {"a"}  # earlier result is not mutated
+
+    path.write_text('{"unit_id": "x"}\n' * 40)
+    os.utime(path, ns=(1, 1))
+    assert screen._validated_file_stats(path)["ids"] == {"x"}
+
+
+def test_step_failures_merge_per_file_counters(tmp_path):
+    from types import SimpleNamespace
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen.run_data = SimpleNamespace(run_dir=tmp_path)
+    screen._last_manifest_status = "running"
+    screen._cached_max_retries = 2
+    screen._terminal_scan_cache = {}
+    screen._chunk_dirs_cache = {}
+    screen._chunk_files_cache = {}
+    screen._failure_stats_cache = {}
+    for name, body in (
+        ("chunk_000", '{"unit_id": "a", "failure_stage": "validation", "retry_count": 1, "error": "bad"}\n'
+                      '{"unit_id": "b", "failure_stage": "pipeline_internal", "error": "boom"}\n'),
+        ("retry_001", '{"unit_id": "a", "failure_stage": "validation", "retry_count": 2, "error": "bad"}\n'
+                      'not json\n'),
+    ):
+        (tmp_path / "chunks" / name).mkdir(parents=True)
+        (tmp_path / "chunks" / name / "gen_failures.jsonl").write_text(body)
+
+    counts = screen._count_step_failures("gen")
+    assert counts == {"validation": 2, "hard": 2, "total": 4, "retrying": 1, "exhausted": 1,
+                      "max_retry_attempt": 1, "max_retries": 2}
+    # The summary only covers chunk_* dirs
+    assert sorted(screen._get_failure_summary("gen")) == [("hard", "boom", 1), ("validation", "bad", 1)]
+
+
+def test_find_chunk_jsonl_uses_listing_and_sees_new_files(tmp_path):
+    import os
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._chunk_files_cache = {}
+    chunk_dir = tmp_path / "chunk_000"
+    chunk_dir.mkdir()
+    (chunk_dir / "gen_validated.jsonl").write_text("{}\n")
+
+    assert screen._find_chunk_jsonl(chunk_dir, "gen_validated.jsonl") == chunk_dir / "gen_validated.jsonl"
+    assert screen._find_chunk_jsonl(chunk_dir, "gen_failures.jsonl") is None
+
+    # Created within the same mtime tick as the listing: seen anyway
+    (chunk_dir / "gen_failures.jsonl.gz").write_bytes(b"")
+    assert screen._find_chunk_jsonl(chunk_dir, "gen_failures.jsonl") == chunk_dir / "gen_failures.jsonl.gz"
+    assert screen._find_chunk_jsonl(tmp_path / "missing", "gen_validated.jsonl") is None
+
+    # Once the directory mtime is old enough the listing is reused
+    os.utime(chunk_dir, ns=(1, 1))
+    assert "gen_failures.jsonl.gz" in screen._list_chunk_files(chunk_dir)
+    (chunk_dir / "gen_failures.jsonl.gz").unlink()
+    os.utime(chunk_dir, ns=(1, 1))
+    assert "gen_failures.jsonl.gz" in screen._list_chunk_files(chunk_dir)
+
+
+def test_probe_process_shared_within_max_age(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    import tui.screens.main_screen as ms
+    calls = []
+    monkeypatch.setattr(ms, "get_run_process_status", lambda d: calls.append(d) or {"alive": True, "pid": 1})
+    monkeypatch.setattr(ms, "has_recent_errors", lambda d: False)
+    screen = ms.MainScreen.__new__(ms.MainScreen)
+    screen.run_data = SimpleNamespace(run_dir=tmp_path)
+    screen._proc_probe_cache = None
+
+    assert screen._probe_process() == ({"alive": True, "pid": 1}, False)
+    screen._probe_process()
+    assert len(calls) == 1
+    screen._probe_process(max_age=0)
+    assert len(calls) == 2
+
+
+def test_filtered_units_cached_until_filters_or_units_change():
+    from types import SimpleNamespace
+    from tui.screens.main_screen import MainScreen
+    screen = SimpleNamespace(status_filter="all", step_filter="all", sort_by="unit_id", _filtered_cache={})
+    screen._sort_units = lambda units: MainScreen._sort_units(screen, units)
+    screen._all_units = [
+        {"unit_id": "b", "status": "failed", "step": "s1"},
+        {"unit_id": "a", "status": "valid", "step": "s2"},
+    ]
+    first = MainScreen._get_filtered_units(screen)
+    assert [u["unit_id"] for u in first] == ["a", "b"]
+    assert MainScreen._get_filtered_units(screen) is first
+
+    screen.sort_by = "status"
+    assert [u["unit_id"] for u in MainScreen._get_filtered_units(screen)] == ["b", "a"]
+    screen.status_filter = "valid"
+    assert [u["unit_id"] for u in MainScreen._get_filtered_units(screen)] == ["a"]
+
+    # Cycling back to an earlier setting reuses the cached list
+    screen.status_filter, screen.sort_by = "all", "unit_id"
+    assert MainScreen._get_filtered_units(screen) is first
+
+
+def test_current_unit_from_log_reads_last_progress_line(tmp_path):
+    from tui.screens.main_screen import MainScreen
+    log = tmp_path / "RUN_LOG.txt"
+    log.write_text("[10:00:00] [1/2] unit_a ✓ ok\n[10:00:01] [2/2] ünit_b ✗ bad\n[10:00:02] done\n",
+                   encoding="utf-8")
+    assert MainScreen._read_current_unit_from_log(log) == "ünit_b"
+
+
+def test_count_jsonl_records_counts_appended_lines(tmp_path):
+    import os
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._record_count_cache = {}
+    path = tmp_path / "gen_validated.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n{"a": 2}\n{"a": 3')  # blank line, partial last row
+
+    assert screen._count_jsonl_records(path) == 3
+    with open(path, "ab") as f:
+        f.write(b'}\n{"a": 4}\n')
+    assert screen._count_jsonl_records(path) == 4
+
+    path.write_bytes(b'{"b": 1}\n' * 6)
+    os.utime(path, ns=(1, 1))
+    assert screen._count_jsonl_records(path) == 6
+
+
+def test_list_chunk_dirs_filters_prefix_and_sees_new_dirs(tmp_path):
+    import os
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._chunk_dirs_cache = {}
+    (tmp_path / "chunk_000").mkdir()
+    (tmp_path / "retry_001").mkdir()
+    (tmp_path / "chunk_notes.txt").write_text("")
+
+    assert screen._list_chunk_dirs(tmp_path, "chunk_") == [tmp_path / "chunk_000"]
+    assert sorted(screen._list_chunk_dirs(tmp_path)) == [tmp_path / "chunk_000", tmp_path / "retry_001"]
+
+    # Created within the same mtime tick as the listing: seen anyway
+    (tmp_path / "chunk_001").mkdir()
+    assert sorted(screen._list_chunk_dirs(tmp_path, "chunk_")) == [tmp_path / "chunk_000", tmp_path / "chunk_001"]
+    assert screen._list_chunk_dirs(tmp_path / "missing") == []
+
+    # Once the directory mtime is old enough the listing is reused
+    os.utime(tmp_path, ns=(1, 1))
+    assert len(screen._list_chunk_dirs(tmp_path, "chunk_")) == 2
+    (tmp_path / "chunk_001").rmdir()
+    os.utime(tmp_path, ns=(1, 1))
+    assert len(screen._list_chunk_dirs(tmp_path, "chunk_")) == 2
+
+
+def test_terminal_scan_memo_dropped_when_run_resumes():
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    screen._terminal_scan_cache = {}
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    screen._last_manifest_status = "complete"
+    assert screen._memo_if_terminal(("valid", ("s1",)), compute) == 1
+    assert screen._memo_if_terminal(("valid", ("s1",)), compute) == 1
+    screen._last_manifest_status = "running"
+    assert screen._memo_if_terminal(("valid", ("s1",)), compute) == 2
+    assert screen._terminal_scan_cache == {}
+
+
+def test_batch_idle_toast_recheck_replaces_pending_timer():
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+    from tui.screens.main_screen import MainScreen
+
+    class FakeTimer:
+        stopped = False
+
+        def stop(self):
+            self.stopped = True
+
+    timers = []
+    screen = MainScreen.__new__(MainScreen)
+    screen.run_data = SimpleNamespace(mode="batch")
+    screen._batch_toast_shown = False
+    screen._latest_submit_cache = None
+    screen._idle_toast_timer = None
+    screen.set_timer = lambda delay, cb: timers.append(FakeTimer()) or timers[-1]
+    manifest = {"status": "running", "chunks": {"chunk_000": {"submitted_at": datetime.now(timezone.utc).isoformat()}}}
+
+    screen._check_batch_idle_toast(manifest)
+    screen._check_batch_idle_toast(manifest)
+    assert len(timers) == 2
+    assert timers[0].stopped and not timers[1].stopped
+    assert screen._idle_toast_timer is timers[1]
+
+
+def test_rate_limited_narrative_update_is_applied_later(monkeypatch):
+    import tui.screens.main_screen as ms
+
+    updates = []
+    timers = []
+    clock = [100.0]
+    monkeypatch.setattr(ms.time, "monotonic", lambda: clock[0])
+    screen = ms.MainScreen.__new__(ms.MainScreen)
+    screen._otto_orchestrator = type("Otto", (), {
+        "update_narrative": lambda self, status, providers, context=None: updates.append(context["n"]),
+    })()
+    screen._last_narrative_status = None
+    screen._last_narrative_ts = 0.0
+    screen._narrative_timer = None
+    screen._get_providers_from_config = lambda: None
+    screen._build_otto_context = lambda manifest: {"n": manifest["n"]}
+    screen.set_timer = lambda delay, cb: timers.append((delay, cb)) or object()
+
+    screen._update_otto_narrative({"n": 1}, "running")
+    clock[0] += 3
+    screen._update_otto_narrative({"n": 2}, "running")  # inside the interval: deferred
+    assert updates == [1]
+    assert len(timers) == 1 and timers[0][0] == ms._NARRATIVE_MIN_INTERVAL - 3
+
+    # No further signature change: the timer applies the latest manifest
+    clock[0] += timers[0][0]
+    screen._load_manifest_cached = lambda: {"status": "running", "n": 2}
+    timers[0][1]()
+    assert updates == [1, 2]
+    assert screen._narrative_timer is None
+
+
+def test_run_dir_watch_filter_reports_manifest_changes_only(tmp_path):
+    import threading
+    import time
+    import pytest
+    watchfiles = pytest.importorskip("watchfiles")
+    from tui.screens.main_screen import _is_refresh_trigger
+
+    def write_files():
+        time.sleep(0.3)
+        (tmp_path / "RUN_LOG.txt").write_text("log\n")
+        (tmp_path / "MANIFEST.json").write_text("{}")
+
+    writer = threading.Thread(target=write_files)
+    writer.start()
+    changes = set()
+    for changes in watchfiles.watch(
+        tmp_path, watch_filter=_is_refresh_trigger, debounce=300,
+        rust_timeout=5000, yield_on_timeout=True,
+    ):
+        break
+    writer.join()
+    assert {Path(path).name for _, path in changes} == {"MANIFEST.json"}
+
+
+def test_pending_units_skip_corrupt_rows(tmp_path, monkeypatch):
+    import tui.utils.json_io as json_io
+    from tui.screens.main_screen import MainScreen
+    screen = MainScreen.__new__(MainScreen)
+    (tmp_path / "gen_input.jsonl").write_bytes(
+        b'{"custom_id": "a"}\n'
+        b'{"custom_id": "b", \n'          # truncated row
+        b'[1, 2]\n'                       # not an object
+        b'{"custom_id": ["x"]}\n'         # unusable id
+        b'\xff\xfe\n'                     # not UTF-8
+        b'{"metadata": {"unit_id": "c"}}\n'
+    )
+    (tmp_path / "gen_prompts.jsonl").write_bytes(b'{"unit_id": "p1"}\nnull\n{"unit_id": {"k": 1}}\n{"unit_id": "p2"}\n')
+
+    for orjson_available in (json_io.ORJSON_AVAILABLE, False):
+        monkeypatch.setattr(json_io, "ORJSON_AVAILABLE", orjson_available)
+        units = screen._load_pending_units_for_chunk(tmp_path, "gen", "gen_SUBMITTED", {"a"})
+        assert [u["unit_id"] for u in units] == ["c"]
+        assert units[0]["status"] == "processing"
+
+        (tmp_path / "gen_input.jsonl").rename(tmp_path / "gen_input.bak")
+        units = screen._load_pending_units_for_chunk(tmp_path, "gen", "gen_PENDING", set())
+        assert [u["unit_id"] for u in units] == ["p1", "p2"]
+        (tmp_path / "gen_input.bak").rename(tmp_path / "gen_input.jsonl")
+
+
+def test_restart_manifest_write_is_fsynced_before_replace(tmp_path, monkeypatch):
+    import tui.screens.home_screen as hs
+    events = []
+    real_fsync, real_replace = hs.os.fsync, hs.os.replace
+    monkeypatch.setattr(hs.os, "fsync", lambda fd: events.append("fsync") or real_fsync(fd))
+    monkeypatch.setattr(hs.os, "replace", lambda src, dst: events.append("replace") or real_replace(src, dst))
+    (tmp_path / "MANIFEST.json").write_text(json.dumps({"status": "failed", "error_message": "boom"}))
+
+    hs.HomeScreen._update_manifest_for_restart(hs.HomeScreen.__new__(hs.HomeScreen), tmp_path)
+
+    assert events == ["fsync", "replace"]
+    manifest = json.loads((tmp_path / "MANIFEST.json").read_text())
+    assert manifest["status"] == "running" and "error_message" not in manifest
+    assert not (tmp_path / "MANIFEST.json.tmp").exists()